@@ -1,16 +1,184 @@
 #!/usr/bin/env python3
 """
 Script to retrieve GitHub PR information for a team within a date range.
-Uses GitHub CLI (gh) to fetch PR data.
+Talks to the GitHub REST and GraphQL APIs directly over persistent HTTPS
+connections, authenticated with GITHUB_TOKEN/GH_TOKEN or the GitHub CLI
+(gh) token.
 """
 
+import http.client
 import json
+import os
+import re
+import sqlite3
 import subprocess
 import sys
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache, partial
+from typing import List, Dict, Any, FrozenSet, Iterator, Optional, Tuple
 import argparse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+GITHUB_API_HOST = 'api.github.com'
+
+# Size of the PR-details pool shared by every repository; kept modest to
+# stay clear of GitHub's secondary (concurrency) rate limits
+MAX_WORKERS = 8
+
+# Repositories processed at once; these threads only run the searches and
+# hand their detail batches to the shared pool
+MAX_REPO_WORKERS = 4
+
+# PRs fetched per GraphQL request (one aliased pullRequest field each)
+BATCH_SIZE = 20
+
+# Fields fetched for every PR. Reviews and comments are capped at the first
+# 100 each, which covers the first-response calculations.
+PR_FIELDS = """
+  number title url state isDraft
+  createdAt updatedAt mergedAt closedAt
+  headRefName baseRefName
+  additions deletions changedFiles
+  author { login }
+  commits { totalCount }
+  labels(first: 20) { nodes { name } }
+  assignees(first: 10) { nodes { login } }
+  reviews(first: 100) { nodes { state submittedAt author { login } } }
+  comments(first: 100) { totalCount nodes { createdAt author { login } } }
+"""
+
+# PR search projected down to the fields list_prs_in_repo needs
+SEARCH_QUERY = """
+query($q: String!, $cursor: String) {
+  search(query: $q, type: ISSUE, first: 100, after: $cursor) {
+    pageInfo { hasNextPage endCursor }
+    nodes { ... on PullRequest { number updatedAt author { login } } }
+  }
+}
+"""
+
+# orjson parses/serialises several times faster than the json module and
+# works on bytes directly; fall back to the standard library without it
+if orjson is not None:
+    json_loads = orjson.loads
+
+    def json_dumps(obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+else:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None, default=asdict).encode()
+
+# Lazily initialised by get_github_token(); connections are per thread
+# because http.client connections must not be shared between threads
+_token = None
+_local = threading.local()
+
+# Serialises progress output from concurrently processed repositories
+_print_lock = threading.Lock()
+
+# One pool fetches PR details for the whole job, so the number of requests
+# in flight stays at MAX_WORKERS however many repositories are processed.
+# Batch tasks never wait on other tasks, so sharing it can't deadlock.
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+# Logins containing any of these (case-insensitive) are treated as bots/AI
+BOT_PATTERNS = [
+    'copilot',
+    'github-actions',
+    'dependabot',
+    'renovate',
+    'bot',
+    '[bot]'
+]
+_BOT_RE = re.compile('|'.join(re.escape(pattern) for pattern in BOT_PATTERNS), re.IGNORECASE)
+
+# On-disk response cache, opened by open_cache() (disabled when None)
+_cache = None
+
+# Format of the PR stats stored in the cache; bump it whenever PRStat gains,
+# loses or renames a field so entries written by older versions are ignored
+PR_STATS_CACHE_VERSION = 1
+
+
+@dataclass
+class PRStat:
+    """
+    Statistics record for one PR, serialised field by field in this order.
+    Slotted because a run can hold thousands of these; the slots are spelt
+    out since dataclass(slots=True) needs Python 3.10.
+    """
+    __slots__ = (
+        'repository',
+        'number',
+        'title',
+        'author',
+        'state',
+        'url',
+        'created_at',
+        'merged_at',
+        'closed_at',
+        'time_to_merge_hours',
+        'time_to_first_response_hours',
+        'time_to_first_comment_hours',
+        'time_to_first_review_hours',
+        'time_to_first_approval_hours',
+        'head_branch',
+        'base_branch',
+        'commits',
+        'changed_files',
+        'additions',
+        'deletions',
+        'total_lines_changed',
+        'review_count',
+        'approvals',
+        'changes_requested',
+        'comment_count',
+        'is_draft',
+        'labels',
+        'assignees',
+    )
+
+    repository: str
+    number: int
+    title: str
+    author: Optional[str]
+    state: str
+    url: str
+    created_at: Optional[str]
+    merged_at: Optional[str]
+    closed_at: Optional[str]
+    time_to_merge_hours: Optional[float]
+    time_to_first_response_hours: Optional[float]
+    time_to_first_comment_hours: Optional[float]
+    time_to_first_review_hours: Optional[float]
+    time_to_first_approval_hours: Optional[float]
+    head_branch: str
+    base_branch: str
+    commits: int
+    changed_files: int
+    additions: int
+    deletions: int
+    total_lines_changed: int
+    review_count: int
+    approvals: int
+    changes_requested: int
+    comment_count: int
+    is_draft: bool
+    labels: Tuple[str, ...]
+    assignees: Tuple[str, ...]
+
 
 def load_json_file(filepath: str) -> Dict:
     """Load and parse a JSON file."""
@@ -34,85 +202,474 @@ def parse_date(date_str: str) -> datetime:
         sys.exit(1)
 
 
-def run_gh_command(args: List[str]) -> str:
-    """Run a GitHub CLI command and return output."""
+def timestamp_to_epoch(timestamp: str, _fromisoformat=datetime.fromisoformat) -> float:
+    """
+    Parse a GitHub ISO-8601 timestamp into seconds since the epoch, so
+    durations are a plain float subtraction.
+
+    GitHub timestamps end in 'Z', which fromisoformat() (C-implemented, much
+    faster than strptime) only accepts from Python 3.11, so it is rewritten
+    as an explicit UTC offset.
+    """
+    if timestamp.endswith('Z'):
+        timestamp = timestamp[:-1] + '+00:00'
+    return _fromisoformat(timestamp).timestamp()
+
+
+def get_github_token() -> str:
+    """
+    Return the GitHub API token.
+
+    Uses GITHUB_TOKEN or GH_TOKEN from the environment, otherwise asks the
+    GitHub CLI once via 'gh auth token' and caches the result.
+    """
+    global _token
+    if _token:
+        return _token
+
+    _token = os.environ.get('GITHUB_TOKEN') or os.environ.get('GH_TOKEN')
+    if _token:
+        return _token
+
     try:
         result = subprocess.run(
-            ['gh'] + args,
+            ['gh', 'auth', 'token'],
             capture_output=True,
             text=True,
             check=True
         )
-        return result.stdout
     except subprocess.CalledProcessError as e:
-        print(f"Error running gh command: {e}")
-        print(f"stderr: {e.stderr}")
-        return None
+        print(f"Error: Could not get a GitHub token from gh: {e.stderr.strip()}", file=sys.stderr)
+        print("Run 'gh auth login' or set GITHUB_TOKEN", file=sys.stderr)
+        sys.exit(1)
     except FileNotFoundError:
-        print("Error: GitHub CLI (gh) not found. Please install it from https://cli.github.com/")
+        print("Error: GitHub CLI (gh) not found. Please install it from https://cli.github.com/ or set GITHUB_TOKEN")
         sys.exit(1)
 
+    _token = result.stdout.strip()
+    return _token
+
+
+def _get_connection() -> http.client.HTTPSConnection:
+    """Return this thread's keep-alive connection to the GitHub API."""
+    connection = getattr(_local, 'connection', None)
+    if connection is None:
+        connection = http.client.HTTPSConnection(GITHUB_API_HOST, timeout=60)
+        _local.connection = connection
+    return connection
+
+
+class ResponseCache:
+    """
+    SQLite cache of GitHub API responses, shared by all worker threads.
+
+    GET responses are stored with their ETag and revalidated with
+    If-None-Match; a 304 reply is free against the rate limit. The computed
+    stats of merged and closed PRs are kept together with the PR's updatedAt
+    and reused only while the search still reports the same updatedAt, since
+    such PRs can be reopened or get further reviews and comments.
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses '
+            '(path TEXT PRIMARY KEY, etag TEXT, link TEXT, body BLOB)'
+        )
+        # Entries from before updatedAt and the format version were stored
+        # can't be validated, so a table in that layout is dropped
+        columns = {row[1] for row in self._db.execute('PRAGMA table_info(pr_stats)')}
+        if columns and 'version' not in columns:
+            self._db.execute('DROP TABLE pr_stats')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS pr_stats '
+            '(repo TEXT, number INTEGER, updated_at TEXT, version INTEGER, data TEXT, '
+            'PRIMARY KEY (repo, number))'
+        )
+        self._db.commit()
+
+    def get_response(self, path: str) -> Optional[Tuple[str, str, bytes]]:
+        """Return (etag, link header, body) stored for a GET path."""
+        with self._lock:
+            return self._db.execute(
+                'SELECT etag, link, body FROM responses WHERE path = ?', (path,)
+            ).fetchone()
+
+    def put_response(self, path: str, etag: str, link: Optional[str], body: bytes):
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)',
+                (path, etag, link, body)
+            )
+            self._db.commit()
+
+    def get_pr_stats(self, repo: str, number: int, updated_at: str) -> Optional[PRStat]:
+        """Return the stored stats of a PR if they are still current as of updated_at."""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT data FROM pr_stats WHERE repo = ? AND number = ? '
+                'AND updated_at = ? AND version = ?',
+                (repo, number, updated_at, PR_STATS_CACHE_VERSION)
+            ).fetchone()
+        if not row:
+            return None
+        try:
+            stats = PRStat(**json_loads(row[0]))
+        except TypeError:
+            # Written with a different set of fields; treat it as a miss
+            return None
+        stats.labels = tuple(stats.labels)
+        stats.assignees = tuple(stats.assignees)
+        return stats
+
+    def put_pr_stats(self, repo: str, number: int, updated_at: str, stats: PRStat):
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO pr_stats VALUES (?, ?, ?, ?, ?)',
+                (repo, number, updated_at, PR_STATS_CACHE_VERSION, json_dumps(stats))
+            )
+            self._db.commit()
+
+
+def open_cache(path: str):
+    """Enable the on-disk response cache stored at path."""
+    global _cache
+    _cache = ResponseCache(path)
+
+
+class RateLimitGate:
+    """
+    Shared view of one rate-limit bucket (core or graphql).
+
+    Every response updates the remaining budget from its X-RateLimit-*
+    headers; once it drops below the threshold, all threads block in wait()
+    until the bucket resets instead of running into 403s.
+    """
+
+    def __init__(self, name: str, threshold: int):
+        self.name = name
+        self.threshold = threshold
+        self._cond = threading.Condition()
+        self._remaining = None
+        self._reset = 0.0
+        self._waiting = False
+
+    def update(self, headers: http.client.HTTPMessage):
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        with self._cond:
+            self._remaining = int(remaining)
+            self._reset = float(reset)
+            self._cond.notify_all()
+
+    def wait(self):
+        with self._cond:
+            while self._remaining is not None and self._remaining < self.threshold:
+                delay = self._reset - time.time()
+                if delay <= 0:
+                    # The window has rolled over; the next response refreshes it
+                    self._remaining = None
+                    break
+                if not self._waiting:
+                    self._waiting = True
+                    log(f"{self.name} rate limit nearly exhausted ({self._remaining} left), "
+                        f"pausing {delay:.0f}s until reset...")
+                self._cond.wait(delay + 1)
+            self._waiting = False
+
+
+_rate_gates = {
+    'core': RateLimitGate('core', 50),
+    'graphql': RateLimitGate('graphql', 50),
+}
+
+
+def _rate_gate(path: str) -> RateLimitGate:
+    """Return the rate-limit bucket a request path is charged against."""
+    if path.startswith('/graphql'):
+        return _rate_gates['graphql']
+    return _rate_gates['core']
+
+
+def _retry_delay(response: http.client.HTTPResponse, body: bytes) -> Optional[float]:
+    """
+    Return how long to wait before retrying a rate-limited response,
+    or None if the response is not a rate-limit error.
+    """
+    retry_after = response.getheader('Retry-After')
+    if retry_after:
+        return float(retry_after)
+
+    if response.getheader('X-RateLimit-Remaining') == '0':
+        reset = int(response.getheader('X-RateLimit-Reset', '0'))
+        return max(reset - time.time(), 0) + 1
+
+    # Secondary rate limits don't always send Retry-After; GitHub asks
+    # clients to wait at least a minute before retrying
+    if b'secondary rate limit' in body:
+        return 60
+
+    return None
+
+
+def github_request(
+    method: str,
+    path: str,
+    params: Dict[str, Any] = None,
+    payload: Any = None,
+    retries: int = 3
+) -> Optional[Tuple[Any, http.client.HTTPMessage]]:
+    """
+    Send a request to the GitHub API and return (decoded JSON, response headers).
+
+    Rate-limited requests are retried after the delay GitHub asks for.
+    GET requests are revalidated against the response cache when enabled.
+    Returns None on any other error.
+    """
+    if params:
+        path = f"{path}?{urllib.parse.urlencode(params)}"
+
+    cached = None
+    if method == 'GET' and _cache is not None:
+        cached = _cache.get_response(path)
+
+    headers = {
+        'Authorization': f'Bearer {get_github_token()}',
+        'Accept': 'application/vnd.github+json',
+        'X-GitHub-Api-Version': '2022-11-28',
+        'User-Agent': 'retrieve_pr_stats',
+    }
+    body = None
+    if payload is not None:
+        body = json_dumps(payload)
+        headers['Content-Type'] = 'application/json'
+    if cached:
+        headers['If-None-Match'] = cached[0]
+
+    gate = _rate_gate(path)
+    for attempt in range(retries + 1):
+        gate.wait()
+        conn = _get_connection()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            raw = response.read()
+        except (http.client.HTTPException, OSError) as e:
+            # Drop the broken connection; the next attempt reconnects
+            conn.close()
+            if attempt == retries:
+                print(f"Error requesting {path}: {e}", file=sys.stderr)
+                return None
+            continue
+        gate.update(response.headers)
+
+        if response.status in (403, 429) and attempt < retries:
+            delay = _retry_delay(response, raw)
+            if delay is not None:
+                print(f"Rate limited on {path}, retrying in {delay:.0f}s...", file=sys.stderr)
+                time.sleep(delay)
+                continue
+
+        if response.status == 304 and cached:
+            # Unchanged since the cached copy; 304s may omit the Link header
+            etag, link, raw = cached
+            if link and 'Link' not in response.headers:
+                response.headers['Link'] = link
+            return json_loads(raw), response.headers
+
+        if response.status >= 400:
+            print(f"Error: GitHub API returned {response.status} for {path}: "
+                  f"{raw.decode(errors='replace')[:200]}", file=sys.stderr)
+            return None
+
+        etag = response.getheader('ETag')
+        if method == 'GET' and _cache is not None and etag:
+            _cache.put_response(path, etag, response.getheader('Link'), raw)
+
+        return (json_loads(raw) if raw else None), response.headers
+
+    return None
+
+
+def github_get(path: str, params: Dict[str, Any] = None) -> Any:
+    """GET a GitHub API path and return the decoded JSON (None on error)."""
+    result = github_request('GET', path, params)
+    return result[0] if result else None
 
+
+def _next_page(headers: http.client.HTTPMessage) -> Optional[str]:
+    """Return the path of the next page from a Link header, if any."""
+    for link in (headers.get('Link') or '').split(','):
+        url, _, rel = link.partition(';')
+        if 'rel="next"' in rel:
+            parts = urllib.parse.urlsplit(url.strip(' <>'))
+            return f"{parts.path}?{parts.query}"
+    return None
+
+
+def github_paginate(path: str, params: Dict[str, Any] = None, limit: int = None) -> Iterator[Any]:
+    """
+    Yield the items of every page of a list endpoint as each page arrives.
+
+    Handles both plain list responses and search responses ({'items': [...]}).
+    Only one page is held at a time, so callers can filter or merge the
+    items without building the full list first.
+    """
+    params = dict(params or {})
+    params.setdefault('per_page', 100)
+    count = 0
+
+    result = github_request('GET', path, params)
+    while result:
+        page, headers = result
+        for item in (page['items'] if isinstance(page, dict) else page):
+            yield item
+            count += 1
+            if limit and count >= limit:
+                return
+
+        next_path = _next_page(headers)
+        if not next_path:
+            break
+        result = github_request('GET', next_path)
+
+
+@lru_cache(maxsize=1024)
 def is_bot_reviewer(reviewer_login: str) -> bool:
     """Check if a reviewer is a bot/AI (e.g., Copilot, github-actions)."""
     if not reviewer_login:
         return False
 
-    reviewer_lower = reviewer_login.lower()
-    bot_patterns = [
-        'copilot',
-        'github-actions',
-        'dependabot',
-        'renovate',
-        'bot',
-        '[bot]'
-    ]
-
-    return any(pattern in reviewer_lower for pattern in bot_patterns)
-
-
-def get_pr_details(repo: str, pr_number: int) -> Dict[str, Any]:
-    """Get detailed information about a specific PR."""
-    pr_json = run_gh_command([
-        'pr', 'view', str(pr_number),
-        '--repo', repo,
-        '--json', 'number,title,author,state,createdAt,mergedAt,closedAt,commits,additions,deletions,changedFiles,reviews,url,headRefName,baseRefName,labels,assignees,isDraft,comments'
-    ])
-
-    if pr_json:
-        pr_data = json.loads(pr_json)
-
-        # Fetch review timeline with timestamps using API
-        # gh pr view doesn't include submittedAt for reviews, so we need to use the API
-        reviews_json = run_gh_command([
-            'api',
-            f'repos/{repo}/pulls/{pr_number}/reviews',
-            '--jq', '.'
-        ])
-
-        if reviews_json:
-            pr_data['reviews_with_timestamps'] = json.loads(reviews_json)
-
-        # Fetch comments timeline with timestamps
-        comments_json = run_gh_command([
-            'api',
-            f'repos/{repo}/issues/{pr_number}/comments',
-            '--jq', '.'
-        ])
-
-        if comments_json:
-            pr_data['comments_with_timestamps'] = json.loads(comments_json)
-
-        return pr_data
-    return None
+    return _BOT_RE.search(reviewer_login) is not None
+
+
+def graphql_query(query: str, variables: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+    """Run a GitHub GraphQL query and return its 'data' (None on error)."""
+    result = github_request('POST', '/graphql', payload={'query': query, 'variables': variables or {}})
+    if not result:
+        return None
+
+    response = result[0]
+    for error in response.get('errors', []):
+        print(f"GraphQL error: {error.get('message')}", file=sys.stderr)
+    return response.get('data')
+
+
+def search_pull_requests(query: str, limit: int = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield {number, updatedAt, author} for each PR matching a search query,
+    page by page.
+
+    Uses GraphQL search so only the fields used are transferred, instead
+    of the full issue objects returned by the REST search endpoint.
+    """
+    cursor = None
+    count = 0
+    while True:
+        data = graphql_query(SEARCH_QUERY, {'q': query, 'cursor': cursor})
+        if not data or not data.get('search'):
+            return
+        search = data['search']
+        for node in search['nodes']:
+            # Non-PR results come back as empty objects
+            if not node:
+                continue
+            yield node
+            count += 1
+            if limit and count >= limit:
+                return
+        page_info = search['pageInfo']
+        if not page_info['hasNextPage']:
+            return
+        cursor = page_info['endCursor']
+
+
+def fetch_pr_stats_batch(repo: str, pr_numbers: List[int],
+                         updated_at: Dict[int, str] = None) -> List[PRStat]:
+    """
+    Fetch a batch of PRs with a single GraphQL request and return their
+    statistics records. Merged and closed PRs found in the response cache
+    with the updatedAt given by the search are not requested again.
+    """
+    stats = {}
+    if _cache is not None and updated_at:
+        for pr_number in pr_numbers:
+            if not updated_at.get(pr_number):
+                continue
+            pr_stats = _cache.get_pr_stats(repo, pr_number, updated_at[pr_number])
+            if pr_stats:
+                stats[pr_number] = pr_stats
+
+    to_fetch = [pr_number for pr_number in pr_numbers if pr_number not in stats]
+    if to_fetch:
+        stats.update(_query_pr_stats(repo, to_fetch))
+
+    return [stats[pr_number] for pr_number in pr_numbers if pr_number in stats]
+
+
+def _query_pr_stats(repo: str, pr_numbers: List[int]) -> Dict[int, PRStat]:
+    """
+    Query GraphQL for several PRs and return their statistics by number.
+
+    Each PR is requested under its own alias (pr0, pr1, ...) so one round-trip
+    returns the PR fields together with its reviews and comments. Each PR is
+    reduced to its stats record straight away and its raw reviews/comments
+    are released, so only the small records outlive this call.
+    """
+    owner, name = repo.split('/', 1)
+    aliases = '\n'.join(
+        f"    pr{i}: pullRequest(number: {pr_number}) {{ ...prFields }}"
+        for i, pr_number in enumerate(pr_numbers)
+    )
+    query = (
+        "query($owner: String!, $name: String!) {\n"
+        "  repository(owner: $owner, name: $name) {\n"
+        f"{aliases}\n"
+        "  }\n"
+        "}\n"
+        f"fragment prFields on PullRequest {{{PR_FIELDS}}}"
+    )
+
+    data = graphql_query(query, {'owner': owner, 'name': name})
+    if not data or not data.get('repository'):
+        return {}
+
+    prs = data.pop('repository')
+    del data
+    stats = {}
+    for i, pr_number in enumerate(pr_numbers):
+        pr_details = prs.pop(f'pr{i}', None)
+        if not pr_details:
+            continue
+        updated_at = pr_details.get('updatedAt')
+        pr_stats = calculate_pr_stats(repo, pr_details)
+        del pr_details
+        stats[pr_number] = pr_stats
+        # Finished PRs rarely change, so keep them for future runs; any later
+        # change (reopening, a new review or comment) bumps updatedAt and the
+        # entry is no longer used
+        if _cache is not None and updated_at and pr_stats.state in ('MERGED', 'CLOSED'):
+            _cache.put_pr_stats(repo, pr_number, updated_at, pr_stats)
+
+    return stats
 
 
 def list_prs_in_repo(repo: str, team_members: List[str] = None, start_date: datetime = None, end_date: datetime = None, state: str = 'all', limit: int = 1000) -> List[Dict]:
-    """List PRs in a repository, optionally filtered by team members and date range."""
-    cmd = ['pr', 'list', '--repo', repo, '--state', state, '--limit', str(limit)]
+    """
+    List PRs in a repository, optionally filtered by team members and date range.
+
+    With a date range, PRs created OR merged in the range are returned. GitHub
+    search can't express "created OR merged" in one query, so two searches are
+    run and the results merged by PR number.
+    """
+    # Build search query with repository and author filters
+    search_parts = [f"repo:{repo}", "is:pr"]
 
-    # Build search query with authors and date filters
-    search_parts = []
+    if state != 'all':
+        search_parts.append(f"is:{state}")
 
     # Add author filter
     if team_members:
@@ -124,68 +681,19 @@ def list_prs_in_repo(repo: str, team_members: List[str] = None, start_date: date
             author_query = f"({author_query})"
         search_parts.append(author_query)
 
-    # Add date range filter
-    # Note: GitHub search doesn't support "created OR merged" in a single query,
-    # so we use created date to narrow results and filter merged dates in Python
-    if start_date and end_date:
-        start_str = start_date.strftime("%Y-%m-%d")
-        end_str = end_date.strftime("%Y-%m-%d")
-        search_parts.append(f"created:>={start_str}")
-        search_parts.append(f"created:<={end_str}")
-
-    # Combine search parts
-    if search_parts:
-        search_query = " ".join(search_parts)
-        cmd.extend(['--search', search_query])
-
-    cmd.extend(['--json', 'number,title,author,state,createdAt,mergedAt'])
-
-    pr_list_json = run_gh_command(cmd)
-
-    if pr_list_json:
-        return json.loads(pr_list_json)
-    return []
-
-
-def filter_prs_by_team_and_date(
-    prs: List[Dict],
-    team_members: List[str],
-    start_date: datetime,
-    end_date: datetime
-) -> List[Dict]:
-    """Filter PRs by team members and date range."""
-    filtered_prs = []
-
-    for pr in prs:
-        # Check if author is in team
-        author = pr.get('author', {}).get('login', '')
-        if author not in team_members:
-            continue
-
-        # Check if PR was created or merged in the date range
-        created_at = pr.get('createdAt')
-        merged_at = pr.get('mergedAt')
-
-        created_date = None
-        merged_date = None
-
-        if created_at:
-            created_date = datetime.strptime(created_at[:10], "%Y-%m-%d")
+    base_query = " ".join(search_parts)
 
-        if merged_at:
-            merged_date = datetime.strptime(merged_at[:10], "%Y-%m-%d")
+    if not (start_date and end_date):
+        return list(search_pull_requests(base_query, limit=limit))
 
-        # Include PR if it was created or merged in the date range
-        in_range = False
-        if created_date and start_date <= created_date <= end_date:
-            in_range = True
-        if merged_date and start_date <= merged_date <= end_date:
-            in_range = True
+    date_range = f"{start_date.strftime('%Y-%m-%d')}..{end_date.strftime('%Y-%m-%d')}"
+    prs_by_number = {}
+    for date_qualifier in ('created', 'merged'):
+        search_query = f"{base_query} {date_qualifier}:{date_range}"
+        for pr in search_pull_requests(search_query, limit=limit):
+            prs_by_number.setdefault(pr['number'], pr)
 
-        if in_range:
-            filtered_prs.append(pr)
-
-    return filtered_prs
+    return list(prs_by_number.values())
 
 
 def fetch_team_members_from_github(org: str, team_slug: str) -> List[str]:
@@ -193,14 +701,9 @@ def fetch_team_members_from_github(org: str, team_slug: str) -> List[str]:
     print(f"Fetching team members for '{team_slug}' from GitHub organization '{org}'...", file=sys.stderr)
 
     # Use GitHub API to get team members
-    team_members_json = run_gh_command([
-        'api',
-        f'/orgs/{org}/teams/{team_slug}/members',
-        '--jq', '.[].login'
-    ])
-
-    if team_members_json:
-        members = [line.strip() for line in team_members_json.strip().split('\n') if line.strip()]
+    members = [member['login'] for member in github_paginate(f'/orgs/{org}/teams/{team_slug}/members')]
+
+    if members:
         print(f"Found {len(members)} members in GitHub team '{team_slug}'", file=sys.stderr)
         return members
     else:
@@ -208,157 +711,193 @@ def fetch_team_members_from_github(org: str, team_slug: str) -> List[str]:
         return []
 
 
-def get_pr_stats(repo: str, pr_numbers: List[int]) -> List[Dict[str, Any]]:
-    """Get detailed statistics for a list of PRs."""
+def calculate_pr_stats(repo: str, pr_details: Dict[str, Any]) -> PRStat:
+    """Calculate the statistics record for one PR from its API details."""
+    get = pr_details.get
+
+    # Calculate review statistics (excluding bot/AI reviews)
+    reviews = get('reviews', {}).get('nodes', [])
+    # Filter out bot reviews (author is null for deleted accounts)
+    human_reviews = [r for r in reviews if not is_bot_reviewer((r.get('author') or {}).get('login', ''))]
+    review_states = [r.get('state') for r in human_reviews]
+    review_count = len(human_reviews)
+    approvals = review_states.count('APPROVED')
+    changes_requested = review_states.count('CHANGES_REQUESTED')
+
+    # Calculate PR size metrics
+    additions = get('additions', 0)
+    deletions = get('deletions', 0)
+    total_lines_changed = additions + deletions
+
+    # Calculate time metrics
+    created_at = get('createdAt')
+    merged_at = get('mergedAt')
+    closed_at = get('closedAt')
+    created_ts = timestamp_to_epoch(created_at) if created_at else None
+
+    time_to_merge_hours = None
+    if created_ts is not None and merged_at:
+        time_to_merge_hours = (timestamp_to_epoch(merged_at) - created_ts) / 3600
+
+    # Get additional metadata
+    # Tuples: fixed-size, no over-allocation, and serialised as JSON arrays
+    labels = tuple(label.get('name') for label in get('labels', {}).get('nodes', ()))
+    assignees = tuple(assignee.get('login') for assignee in get('assignees', {}).get('nodes', ()))
+    is_draft = get('isDraft', False)
+    comments = get('comments', {})
+    comment_count = comments.get('totalCount', 0)
+
+    # Calculate first response times. GitHub timestamps share one fixed
+    # ISO 8601 UTC format, so they sort chronologically as strings: take the
+    # earliest of each kind with min() over the raw strings and only parse
+    # the winners, rather than parsing every review and comment.
+    first_comment_hours = None
+    first_review_hours = None
+    first_approval_hours = None
+    first_response_hours = None
+
+    if created_ts is not None:
+        def hours_since_created(timestamp: Optional[str]) -> Optional[float]:
+            if not timestamp:
+                return None
+            try:
+                return (timestamp_to_epoch(timestamp) - created_ts) / 3600
+            except (ValueError, AttributeError):
+                # Skip if we can't parse the timestamp
+                return None
+
+        review_times = [r.get('submittedAt') for r in human_reviews]
+        first_review = min(filter(None, review_times), default=None)
+        first_approval = min(
+            (t for t, state in zip(review_times, review_states) if t and state == 'APPROVED'),
+            default=None
+        )
+        # Skip bot/AI comments (author is null for deleted accounts)
+        first_comment = min(
+            (c.get('createdAt') for c in comments.get('nodes', [])
+             if c.get('createdAt') and not is_bot_reviewer((c.get('author') or {}).get('login', ''))),
+            default=None
+        )
+
+        first_review_hours = hours_since_created(first_review)
+        first_approval_hours = hours_since_created(first_approval)
+        first_comment_hours = hours_since_created(first_comment)
+        # First response is the earliest of any activity
+        first_response_hours = hours_since_created(min(filter(None, (first_review, first_comment)), default=None))
+
+    return PRStat(
+        repository=repo,
+        number=get('number'),
+        title=get('title'),
+        author=(get('author') or {}).get('login'),
+        state=get('state'),
+        url=get('url'),
+        created_at=created_at,
+        merged_at=merged_at,
+        closed_at=closed_at,
+        time_to_merge_hours=round(time_to_merge_hours, 2) if time_to_merge_hours else None,
+        time_to_first_response_hours=round(first_response_hours, 2) if first_response_hours is not None else None,
+        time_to_first_comment_hours=round(first_comment_hours, 2) if first_comment_hours is not None else None,
+        time_to_first_review_hours=round(first_review_hours, 2) if first_review_hours is not None else None,
+        time_to_first_approval_hours=round(first_approval_hours, 2) if first_approval_hours is not None else None,
+        head_branch=get('headRefName'),
+        base_branch=get('baseRefName'),
+        commits=get('commits', {}).get('totalCount', 0),
+        changed_files=get('changedFiles'),
+        additions=additions,
+        deletions=deletions,
+        total_lines_changed=total_lines_changed,
+        review_count=review_count,
+        approvals=approvals,
+        changes_requested=changes_requested,
+        comment_count=comment_count,
+        is_draft=is_draft,
+        labels=labels,
+        assignees=assignees
+    )
+
+
+def log(message: str):
+    """Print a progress message to stderr without interleaving between threads."""
+    with _print_lock:
+        print(message, file=sys.stderr)
+
+
+def get_pr_stats(repo: str, pr_numbers: List[int], updated_at: Dict[int, str] = None) -> List[PRStat]:
+    """
+    Get detailed statistics for a list of PRs, fetching batches on the shared pool.
+
+    updated_at maps PR numbers to the updatedAt reported by the search, which
+    decides whether cached stats can be reused.
+    """
     pr_stats = []
+    batches = [pr_numbers[i:i + BATCH_SIZE] for i in range(0, len(pr_numbers), BATCH_SIZE)]
 
-    for pr_num in pr_numbers:
-        print(f"  Fetching details for PR #{pr_num}...", file=sys.stderr)
-        pr_details = get_pr_details(repo, pr_num)
-
-        if pr_details:
-            # Calculate review statistics (excluding bot/AI reviews)
-            reviews = pr_details.get('reviews', [])
-            # Filter out bot reviews
-            human_reviews = [r for r in reviews if not is_bot_reviewer(r.get('author', {}).get('login', ''))]
-            review_count = len(human_reviews)
-            approvals = sum(1 for r in human_reviews if r.get('state') == 'APPROVED')
-            changes_requested = sum(1 for r in human_reviews if r.get('state') == 'CHANGES_REQUESTED')
-
-            # Calculate PR size metrics
-            additions = pr_details.get('additions', 0)
-            deletions = pr_details.get('deletions', 0)
-            total_lines_changed = additions + deletions
-
-            # Calculate time metrics
-            created_at = pr_details.get('createdAt')
-            merged_at = pr_details.get('mergedAt')
-            closed_at = pr_details.get('closedAt')
-
-            time_to_merge_hours = None
-            if created_at and merged_at:
-                created_dt = datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%SZ")
-                merged_dt = datetime.strptime(merged_at, "%Y-%m-%dT%H:%M:%SZ")
-                time_to_merge_hours = (merged_dt - created_dt).total_seconds() / 3600
-
-            # Get additional metadata
-            labels = [label.get('name') for label in pr_details.get('labels', [])]
-            assignees = [assignee.get('login') for assignee in pr_details.get('assignees', [])]
-            is_draft = pr_details.get('isDraft', False)
-            comment_count = len(pr_details.get('comments', []))
-
-            # Calculate first response times
-            first_comment_hours = None
-            first_review_hours = None
-            first_approval_hours = None
-            first_response_hours = None
-
-            if created_at:
-                created_dt = datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%SZ")
-                earliest_times = []
-
-                # Process reviews with timestamps (excluding bot/AI reviews)
-                reviews_with_ts = pr_details.get('reviews_with_timestamps', [])
-                for review in reviews_with_ts:
-                    # Skip bot reviews
-                    reviewer_login = review.get('user', {}).get('login', '')
-                    if is_bot_reviewer(reviewer_login):
-                        continue
-
-                    submitted_at = review.get('submitted_at')
-                    if submitted_at:
-                        try:
-                            # Handle different timestamp formats
-                            if submitted_at.endswith('Z'):
-                                review_dt = datetime.strptime(submitted_at, "%Y-%m-%dT%H:%M:%SZ")
-                            else:
-                                # Try ISO format with timezone
-                                review_dt = datetime.fromisoformat(submitted_at.replace('Z', '+00:00'))
-                                review_dt = review_dt.replace(tzinfo=None)  # Make naive for comparison
-
-                            hours_to_review = (review_dt - created_dt).total_seconds() / 3600
-
-                            # Track first review
-                            if first_review_hours is None or hours_to_review < first_review_hours:
-                                first_review_hours = hours_to_review
-
-                            # Track first approval
-                            if review.get('state') == 'APPROVED':
-                                if first_approval_hours is None or hours_to_review < first_approval_hours:
-                                    first_approval_hours = hours_to_review
-
-                            earliest_times.append(hours_to_review)
-                        except (ValueError, AttributeError) as e:
-                            # Skip if we can't parse the timestamp
-                            pass
-
-                # Process comments with timestamps (excluding bot/AI comments)
-                comments_with_ts = pr_details.get('comments_with_timestamps', [])
-                for comment in comments_with_ts:
-                    # Skip bot comments
-                    commenter_login = comment.get('user', {}).get('login', '')
-                    if is_bot_reviewer(commenter_login):
-                        continue
-
-                    comment_created = comment.get('created_at')
-                    if comment_created:
-                        try:
-                            if comment_created.endswith('Z'):
-                                comment_dt = datetime.strptime(comment_created, "%Y-%m-%dT%H:%M:%SZ")
-                            else:
-                                comment_dt = datetime.fromisoformat(comment_created.replace('Z', '+00:00'))
-                                comment_dt = comment_dt.replace(tzinfo=None)
-
-                            hours_to_comment = (comment_dt - created_dt).total_seconds() / 3600
-
-                            # Track first comment
-                            if first_comment_hours is None or hours_to_comment < first_comment_hours:
-                                first_comment_hours = hours_to_comment
-
-                            earliest_times.append(hours_to_comment)
-                        except (ValueError, AttributeError) as e:
-                            pass
-
-                # First response is the earliest of any activity
-                if earliest_times:
-                    first_response_hours = min(earliest_times)
-
-            # Build stats dictionary
-            stats = {
-                'repository': repo,
-                'number': pr_details.get('number'),
-                'title': pr_details.get('title'),
-                'author': pr_details.get('author', {}).get('login'),
-                'state': pr_details.get('state'),
-                'url': pr_details.get('url'),
-                'created_at': created_at,
-                'merged_at': merged_at,
-                'closed_at': closed_at,
-                'time_to_merge_hours': round(time_to_merge_hours, 2) if time_to_merge_hours else None,
-                'time_to_first_response_hours': round(first_response_hours, 2) if first_response_hours is not None else None,
-                'time_to_first_comment_hours': round(first_comment_hours, 2) if first_comment_hours is not None else None,
-                'time_to_first_review_hours': round(first_review_hours, 2) if first_review_hours is not None else None,
-                'time_to_first_approval_hours': round(first_approval_hours, 2) if first_approval_hours is not None else None,
-                'head_branch': pr_details.get('headRefName'),
-                'base_branch': pr_details.get('baseRefName'),
-                'commits': len(pr_details.get('commits', [])),
-                'changed_files': pr_details.get('changedFiles'),
-                'additions': additions,
-                'deletions': deletions,
-                'total_lines_changed': total_lines_changed,
-                'review_count': review_count,
-                'approvals': approvals,
-                'changes_requested': changes_requested,
-                'comment_count': comment_count,
-                'is_draft': is_draft,
-                'labels': labels,
-                'assignees': assignees
-            }
-            pr_stats.append(stats)
+    # map() keeps results in pr_numbers order while the fetches overlap with
+    # each other and with other repositories' batches
+    results = _executor.map(partial(fetch_pr_stats_batch, repo, updated_at=updated_at), batches)
+    for batch, batch_stats in zip(batches, results):
+        log(f"  {repo}: fetched details for {len(batch)} PR(s) (#{batch[0]}..#{batch[-1]})")
+        pr_stats.extend(batch_stats)
 
     return pr_stats
 
 
+def process_repo(repo: str, team_members: List[str], start_date: datetime,
+                 end_date: datetime, team_member_set: FrozenSet[str] = frozenset()) -> List[PRStat]:
+    """
+    List the team's PRs in one repository and collect their stats.
+
+    team_member_set holds the lower-cased logins (GitHub logins are
+    case-insensitive) and guards against search results by other authors.
+    """
+    log(f"\nProcessing repository: {repo}")
+
+    # List PRs by team members created or merged in the date range
+    prs = list_prs_in_repo(repo, team_members=team_members, start_date=start_date, end_date=end_date)
+    if team_member_set:
+        prs = [pr for pr in prs if (pr.get('author') or {}).get('login', '').lower() in team_member_set]
+    log(f"{repo}: found {len(prs)} PRs (created or merged in date range)")
+
+    # Get detailed stats
+    pr_numbers = [pr['number'] for pr in prs]
+    if not pr_numbers:
+        return []
+    updated_at = {pr['number']: pr.get('updatedAt') for pr in prs}
+    return get_pr_stats(repo, pr_numbers, updated_at)
+
+
+class PRStatsWriter:
+    """
+    Write the output JSON incrementally so PR records are never all held in
+    memory. total_prs precedes the records, so space is reserved for it in
+    the header and the final count is patched in by close().
+    """
+
+    TOTAL_WIDTH = 12
+
+    def __init__(self, f, header: Dict[str, Any]):
+        self._f = f
+        self.count = 0
+        # Reopen the serialised header object by dropping its closing "\n}"
+        f.write(json_dumps(header, indent=True)[:-2] + b',\n  "total_prs": ')
+        self._total_pos = f.tell()
+        f.write(b' ' * self.TOTAL_WIDTH + b'\n  "pull_requests": [')
+
+    def write(self, pr_stats: List[PRStat]):
+        """Append PR records, indented to match the surrounding document."""
+        for stats in pr_stats:
+            record = json_dumps(stats, indent=True).replace(b'\n', b'\n    ')
+            self._f.write((b',\n    ' if self.count else b'\n    ') + record)
+            self.count += 1
+        self._f.flush()
+
+    def close(self):
+        self._f.write(b'\n  ]\n}' if self.count else b']\n}')
+        self._f.seek(self._total_pos)
+        self._f.write(f'{self.count},'.ljust(self.TOTAL_WIDTH).encode())
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Retrieve GitHub PR statistics for a team within a date range'
@@ -387,9 +926,22 @@ def main():
         default='SolaceDev',
         help='GitHub organization name (default: SolaceDev, used with --fetch-team-from-github)'
     )
+    parser.add_argument(
+        '--cache-file',
+        default='.gh_cache.sqlite',
+        help='SQLite file caching GitHub API responses between runs (default: .gh_cache.sqlite)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the GitHub API response cache'
+    )
 
     args = parser.parse_args()
 
+    if not args.no_cache:
+        open_cache(args.cache_file)
+
     # Load configuration
     print(f"Loading configuration from {args.config_file}...", file=sys.stderr)
     config = load_json_file(args.config_file)
@@ -429,48 +981,34 @@ def main():
             team_members = team_data['teams'][team_name]['members']
 
     print(f"Team '{team_name}' has {len(team_members)} members: {', '.join(team_members)}", file=sys.stderr)
+    team_member_set = frozenset(member.lower() for member in team_members)
     print(f"Date range: {config['start_date']} to {config['end_date']}", file=sys.stderr)
 
-    # Collect PR stats for all repositories
-    all_pr_stats = []
-
-    for repo in repositories:
-        print(f"\nProcessing repository: {repo}", file=sys.stderr)
-
-        # List PRs filtered by team members and date range
-        print(f"Fetching PRs from {repo} for team members in date range...", file=sys.stderr)
-        prs = list_prs_in_repo(repo, team_members=team_members, start_date=start_date, end_date=end_date)
-        print(f"Found {len(prs)} PRs created by team members in date range", file=sys.stderr)
-
-        # Filter to also include PRs merged (but not created) in date range
-        filtered_prs = filter_prs_by_team_and_date(prs, team_members, start_date, end_date)
-        print(f"Total {len(filtered_prs)} PRs (created or merged in date range)", file=sys.stderr)
-
-        # Get detailed stats
-        pr_numbers = [pr['number'] for pr in filtered_prs]
-        if pr_numbers:
-            pr_stats = get_pr_stats(repo, pr_numbers)
-            all_pr_stats.extend(pr_stats)
-
-    # Prepare output
-    output_data = {
+    # Stream results into the output file as each repository finishes;
+    # map() keeps them in config order even though the repositories are
+    # processed concurrently
+    header = {
         'team': team_name,
         'start_date': config['start_date'],
         'end_date': config['end_date'],
         'repositories': repositories,
         'team_members': team_members,
-        'total_prs': len(all_pr_stats),
-        'pull_requests': all_pr_stats
     }
-
-    # Write output
     print(f"\nWriting results to {args.output}...", file=sys.stderr)
-    with open(args.output, 'w') as f:
-        json.dump(output_data, f, indent=2)
-
-    print(f"\nDone! Found {len(all_pr_stats)} PRs for team '{team_name}'", file=sys.stderr)
+    with open(args.output, 'wb') as f:
+        writer = PRStatsWriter(f, header)
+        if repositories:
+            with ThreadPoolExecutor(max_workers=min(MAX_REPO_WORKERS, len(repositories))) as executor:
+                results = executor.map(
+                    partial(process_repo, team_members=team_members, start_date=start_date, end_date=end_date,
+                            team_member_set=team_member_set),
+                    repositories)
+                for pr_stats in results:
+                    writer.write(pr_stats)
+        writer.close()
+
+    print(f"\nDone! Found {writer.count} PRs for team '{team_name}'", file=sys.stderr)
     print(f"Results written to: {args.output}", file=sys.stderr)
 
-
 if __name__ == '__main__':
     main()
@@ -4,38 +4,185 @@ Sort PRs by time to first response (review, comment, or approval).
 Uses data from the JSON file (no GitHub API calls).
 """
 
+import argparse
+import hashlib
+import heapq
+import http.client
 import json
+import math
+import mmap
+import os
+import pickle
+import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from operator import attrgetter
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    def parse_datetime(value, _fromisoformat=datetime.fromisoformat, _utc=timezone.utc):
+        """
+        Parse a GitHub ISO 8601 timestamp. fromisoformat() only accepts a
+        trailing 'Z' from Python 3.11, so it is sliced off and UTC attached.
+        """
+        if value.endswith('Z'):
+            return _fromisoformat(value[:-1]).replace(tzinfo=_utc)
+        return _fromisoformat(value)
+
+# GitHub token (read once) and per-thread keep-alive API connections, used
+# only by the optional timeline helpers below
+_token = None
+_local = threading.local()
+
+# Files larger than this are parsed incrementally with ijson (when installed)
+# so the raw text is never held in memory next to the parsed objects
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Parsed results are pickled here between runs (see load_cached); the cache
+# lives under the user's home rather than /tmp so nobody else can plant a pickle
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pr_sort')
+
+# Part of the cache key; bump when the cached objects change shape
+CACHE_FORMAT = 2
+
+
+def parse_json_file(f):
+    """
+    Parse an open JSON file with orjson straight from a read-only memory map.
 
+    The parser reads the mapped pages directly, so the raw text is never
+    copied into a bytes object; without orjson the stdlib parser reads it.
+    """
+    if not orjson or os.fstat(f.fileno()).st_size == 0:
+        return json.load(f)
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mm) as view:
+            return orjson.loads(view)
 
-def get_pr_review_timeline(repo, pr_number):
+
+def load_pull_requests(path):
     """
-    Get the timeline of reviews and comments for a PR using gh CLI.
+    Yield the pull_requests from a results file.
 
-    Returns dict with:
-        - first_comment_hours: Time to first comment
-        - first_review_hours: Time to first review
-        - first_approval_hours: Time to first approval
+    Large files are streamed one PR object at a time with ijson, so only the
+    PR being consumed is held in memory; otherwise the whole file is parsed
+    at once (with orjson when available).
+    """
+    with open(path, 'rb') as f:
+        if ijson and os.fstat(f.fileno()).st_size > STREAM_THRESHOLD_BYTES:
+            yield from ijson.items(f, 'pull_requests.item', use_float=True)
+            return
+        data = parse_json_file(f)
+    yield from data.get('pull_requests', [])
+
+
+def load_cached(path, loader):
+    """
+    Return loader(path), memoized on disk across runs.
+
+    The pickle is keyed by this script, the loader, CACHE_FORMAT and the
+    input's absolute path, and stores the file's mtime and size alongside
+    the result, so any change to the input rebuilds it. Bump CACHE_FORMAT
+    whenever what the loader returns changes. This function is copied
+    verbatim into each of the sort_prs_by_*.py scripts; keep them identical.
     """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = f"{os.path.basename(__file__)}:{loader.__qualname__}:{CACHE_FORMAT}:{path}"
+    cache_file = os.path.join(CACHE_DIR, hashlib.sha256(key.encode()).hexdigest() + '.pkl')
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_stamp, result = pickle.load(f)
+        if cached_stamp == stamp:
+            return result
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError, ImportError):
+        pass
+
+    result = loader(path)
     try:
-        # Get PR details including timeline
-        cmd = f'gh api repos/{repo}/pulls/{pr_number}/reviews'
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((stamp, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Caching is best effort; a read-only home directory just means no speed-up
+        pass
+    return result
+
 
-        if result.returncode != 0:
-            return None
+def get_github_token():
+    """Return the GitHub token from GITHUB_TOKEN/GH_TOKEN or 'gh auth token' (read once)."""
+    global _token
+    if _token is None:
+        _token = os.environ.get('GITHUB_TOKEN') or os.environ.get('GH_TOKEN')
+        if not _token:
+            result = subprocess.run(['gh', 'auth', 'token'], capture_output=True, text=True, timeout=10)
+            _token = result.stdout.strip()
+    return _token
 
-        reviews = json.loads(result.stdout)
 
-        # Get comments timeline
-        cmd = f'gh api repos/{repo}/issues/{pr_number}/comments'
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
+def github_get(path):
+    """GET a GitHub REST API path over this thread's keep-alive connection."""
+    connection = getattr(_local, 'connection', None)
+    if connection is None:
+        connection = _local.connection = http.client.HTTPSConnection('api.github.com', timeout=10)
+
+    try:
+        connection.request('GET', path, headers={
+            'Authorization': f'Bearer {get_github_token()}',
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': 'sort_prs_by_first_response',
+        })
+        response = connection.getresponse()
+        body = response.read()
+    except (http.client.HTTPException, OSError):
+        # Drop the broken connection so the next request reconnects
+        connection.close()
+        raise
+
+    if response.status != 200:
+        raise RuntimeError(f"GitHub API returned {response.status} for {path}")
+    return json.loads(body)
+
+
+def get_pr_review_timeline(repo, pr_number):
+    """
+    Get the timeline of reviews and comments for a PR from the GitHub API.
+
+    Returns dict with:
+        - reviews: Reviews of the PR
+        - comments: Issue comments on the PR
+    """
+    try:
+        reviews = github_get(f'/repos/{repo}/pulls/{pr_number}/reviews?per_page=100')
 
         comments = []
-        if result.returncode == 0:
-            comments = json.loads(result.stdout)
+        try:
+            comments = github_get(f'/repos/{repo}/issues/{pr_number}/comments?per_page=100')
+        except (RuntimeError, http.client.HTTPException, OSError):
+            pass
 
         return {
             'reviews': reviews,
@@ -46,6 +193,17 @@ def get_pr_review_timeline(repo, pr_number):
         return None
 
 
+def get_pr_review_timelines(repo, pr_numbers, max_workers=20):
+    """
+    Fetch the review timelines of several PRs concurrently.
+
+    Returns a dict mapping PR number to its timeline (None on error).
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        timelines = executor.map(partial(get_pr_review_timeline, repo), pr_numbers)
+        return dict(zip(pr_numbers, timelines))
+
+
 def calculate_time_to_first_response(pr, timeline_data=None):
     """
     Calculate time to first response (comment, review, or approval).
@@ -56,7 +214,7 @@ def calculate_time_to_first_response(pr, timeline_data=None):
     if not created_at:
         return None
 
-    created_dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+    created_dt = parse_datetime(created_at)
 
     result = {
         'first_comment_hours': None,
@@ -68,65 +226,99 @@ def calculate_time_to_first_response(pr, timeline_data=None):
     if not timeline_data:
         return result
 
-    earliest_times = []
+    # Track the four minima as locals and store them in result once at the end
+    inf = math.inf
+    first_comment = first_review = first_approval = inf
+    per_hour = 1 / 3600
 
     # Process reviews
-    if timeline_data.get('reviews'):
-        for review in timeline_data['reviews']:
-            submitted_at = review.get('submitted_at')
-            if submitted_at:
-                review_dt = datetime.fromisoformat(submitted_at.replace('Z', '+00:00'))
-                hours = (review_dt - created_dt).total_seconds() / 3600
+    for review in timeline_data.get('reviews') or ():
+        submitted_at = review.get('submitted_at')
+        if submitted_at:
+            hours = (parse_datetime(submitted_at) - created_dt).total_seconds() * per_hour
+            if hours < first_review:
+                first_review = hours
+            if hours < first_approval and review.get('state') == 'APPROVED':
+                first_approval = hours
 
-                if result['first_review_hours'] is None or hours < result['first_review_hours']:
-                    result['first_review_hours'] = hours
-
-                if review.get('state') == 'APPROVED':
-                    if result['first_approval_hours'] is None or hours < result['first_approval_hours']:
-                        result['first_approval_hours'] = hours
+    # Process comments
+    for comment in timeline_data.get('comments') or ():
+        created_at_comment = comment.get('created_at')
+        if created_at_comment:
+            hours = (parse_datetime(created_at_comment) - created_dt).total_seconds() * per_hour
+            if hours < first_comment:
+                first_comment = hours
 
-                earliest_times.append(hours)
+    # First response is the earliest of any activity
+    first_response = min(first_review, first_comment)
 
-    # Process comments
-    if timeline_data.get('comments'):
-        for comment in timeline_data['comments']:
-            created_at_comment = comment.get('created_at')
-            if created_at_comment:
-                comment_dt = datetime.fromisoformat(created_at_comment.replace('Z', '+00:00'))
-                hours = (comment_dt - created_dt).total_seconds() / 3600
+    result['first_comment_hours'] = None if first_comment == inf else first_comment
+    result['first_review_hours'] = None if first_review == inf else first_review
+    result['first_approval_hours'] = None if first_approval == inf else first_approval
+    result['first_response_hours'] = None if first_response == inf else first_response
 
-                if result['first_comment_hours'] is None or hours < result['first_comment_hours']:
-                    result['first_comment_hours'] = hours
+    return result
 
-                earliest_times.append(hours)
 
-    # Calculate first response (earliest of any activity)
-    if earliest_times:
-        result['first_response_hours'] = min(earliest_times)
+@dataclass
+class PR:
+    """
+    One PR from the results file, flattened to the fields the tables use.
+    Slotted, since a team dump can hold thousands of these; the slots are
+    listed by hand because dataclass(slots=True) needs Python 3.10.
+    """
+    __slots__ = (
+        'number', 'title', 'author', 'state', 'url', 'created_at',
+        'time_to_merge_hours', 'total_lines_changed', 'review_count', 'approvals',
+        'first_comment_hours', 'first_review_hours', 'first_approval_hours', 'first_response_hours',
+    )
 
-    return result
+    number: int
+    title: str
+    author: str
+    state: str
+    url: str
+    created_at: Optional[str]
+    time_to_merge_hours: Optional[float]
+    total_lines_changed: int
+    review_count: int
+    approvals: int
+    first_comment_hours: Optional[float]
+    first_review_hours: Optional[float]
+    first_approval_hours: Optional[float]
+    first_response_hours: Optional[float]
 
 
 def enrich_prs_with_response_times(prs):
     """
     Enrich PRs with response time data from the JSON file itself.
     The data is already present in results.json, so no GitHub API calls are needed.
-    """
-    enriched_prs = []
-
-    for pr in prs:
-        # Extract timing data that's already in the JSON
-        response_times = {
-            'first_comment_hours': pr.get('time_to_first_comment_hours'),
-            'first_review_hours': pr.get('time_to_first_review_hours'),
-            'first_approval_hours': pr.get('time_to_first_approval_hours'),
-            'first_response_hours': pr.get('time_to_first_response_hours')
-        }
 
-        pr['response_times'] = response_times
-        enriched_prs.append(pr)
+    prs may be any iterable (load_pull_requests yields them lazily); each raw
+    dict is converted as it arrives and not retained.
 
-    return enriched_prs
+    Returns PR records with the response times as flat attributes.
+    """
+    return [
+        PR(
+            number=pr.get('number'),
+            title=pr.get('title'),
+            author=pr.get('author'),
+            state=pr.get('state'),
+            url=pr.get('url'),
+            created_at=pr.get('created_at'),
+            time_to_merge_hours=pr.get('time_to_merge_hours'),
+            total_lines_changed=pr.get('total_lines_changed'),
+            review_count=pr.get('review_count'),
+            approvals=pr.get('approvals'),
+            # Extract timing data that's already in the JSON
+            first_comment_hours=pr.get('time_to_first_comment_hours'),
+            first_review_hours=pr.get('time_to_first_review_hours'),
+            first_approval_hours=pr.get('time_to_first_approval_hours'),
+            first_response_hours=pr.get('time_to_first_response_hours'),
+        )
+        for pr in prs
+    ]
 
 
 def format_hours(hours):
@@ -143,19 +335,36 @@ def format_hours(hours):
         return f"{days:.1f}d"
 
 
+# The hour columns shown by the markdown and text tables, in column order
+HOUR_COLUMNS = ('first_response_hours', 'first_review_hours', 'first_approval_hours', 'time_to_merge_hours')
+
+
+def format_hour_columns(prs):
+    """
+    Yield the formatted HOUR_COLUMNS of each PR as a tuple of strings.
+
+    Each column is fed through format_hours with map(), so the per-row loop
+    in the printers only unpacks ready-made strings.
+    """
+    return zip(*(map(format_hours, map(attrgetter(field), prs)) for field in HOUR_COLUMNS))
+
+
 def format_date(date_str):
     """Format ISO date string to shorter format."""
     if not date_str:
         return "N/A"
-    try:
-        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        return dt.strftime('%Y-%m-%d')
-    except:
-        return date_str[:10]
+    # The date part of an ISO 8601 timestamp is already YYYY-MM-DD, so there
+    # is nothing to gain from parsing it (the old fallback sliced it anyway)
+    return date_str[:10]
 
 
+@lru_cache(maxsize=4096)
 def truncate(text, length=50):
-    """Truncate text to specified length."""
+    """
+    Truncate text to specified length.
+
+    Memoized: the same author names come up on many rows of a table.
+    """
     if not text:
         return ""
     if len(text) <= length:
@@ -163,19 +372,34 @@ def truncate(text, length=50):
     return text[:length-3] + "..."
 
 
+# Sort option -> PR attribute
+SORT_FIELDS = {
+    'first_response': 'first_response_hours',
+    'first_review': 'first_review_hours',
+    'first_comment': 'first_comment_hours',
+    'first_approval': 'first_approval_hours',
+    'total_time': 'time_to_merge_hours',
+}
+
+
 def print_table(prs, sort_by='first_response', ascending=False, format_type='text', limit=None):
     """Print PRs in table format sorted by response time."""
 
-    # Sort PRs
-    sort_keys = {
-        'first_response': lambda pr: pr.get('response_times', {}).get('first_response_hours') if pr.get('response_times', {}).get('first_response_hours') is not None else float('inf'),
-        'first_review': lambda pr: pr.get('response_times', {}).get('first_review_hours') if pr.get('response_times', {}).get('first_review_hours') is not None else float('inf'),
-        'first_comment': lambda pr: pr.get('response_times', {}).get('first_comment_hours') if pr.get('response_times', {}).get('first_comment_hours') is not None else float('inf'),
-        'first_approval': lambda pr: pr.get('response_times', {}).get('first_approval_hours') if pr.get('response_times', {}).get('first_approval_hours') is not None else float('inf'),
-        'total_time': lambda pr: pr.get('time_to_merge_hours') if pr.get('time_to_merge_hours') is not None else float('inf'),
-    }
-
-    sorted_prs = sorted(prs, key=sort_keys.get(sort_by, sort_keys['first_response']), reverse=not ascending)
+    # Sort PRs. The sort column is extracted once with a C-level attrgetter
+    # (missing values sort as infinity) and the PR indexes are sorted by it.
+    column = list(map(attrgetter(SORT_FIELDS.get(sort_by, 'first_response_hours')), prs))
+    inf = float('inf')
+    column = [inf if value is None else value for value in column]
+
+    indexes = range(len(prs))
+    if limit and 0 < limit < len(prs) // 4:
+        # Only the top rows are shown: a heap selection is O(n log k) and
+        # gives the same rows, in the same order, as sorting and slicing
+        select = heapq.nsmallest if ascending else heapq.nlargest
+        order = select(limit, indexes, key=column.__getitem__)
+    else:
+        order = sorted(indexes, key=column.__getitem__, reverse=not ascending)
+    sorted_prs = [prs[i] for i in order]
 
     if limit:
         sorted_prs = sorted_prs[:limit]
@@ -199,40 +423,48 @@ def print_csv(prs):
         'First Review', 'First Approval', 'Total Time', 'Created', 'Lines', 'Reviews', 'Approvals'
     ])
 
-    for pr in prs:
-        rt = pr.get('response_times', {})
-        writer.writerow([
-            pr.get('number', ''),
-            pr.get('title', ''),
-            pr.get('author', ''),
-            pr.get('state', ''),
-            rt.get('first_response_hours', ''),
-            rt.get('first_comment_hours', ''),
-            rt.get('first_review_hours', ''),
-            rt.get('first_approval_hours', ''),
-            pr.get('time_to_merge_hours', ''),
-            format_date(pr.get('created_at')),
-            pr.get('total_lines_changed', ''),
-            pr.get('review_count', ''),
-            pr.get('approvals', '')
-        ])
+    # Hand every row to the csv module in one writerows() call
+    writer.writerows(
+        (
+            pr.number,
+            pr.title,
+            pr.author,
+            pr.state,
+            pr.first_response_hours,
+            pr.first_comment_hours,
+            pr.first_review_hours,
+            pr.first_approval_hours,
+            pr.time_to_merge_hours,
+            format_date(pr.created_at),
+            pr.total_lines_changed,
+            pr.review_count,
+            pr.approvals
+        )
+        for pr in prs
+    )
 
 
 def print_markdown(prs):
     """Print PRs in Markdown table format."""
-    print("| PR# | Title | Author | First Response | First Review | First Approval | Total Time | Lines |")
-    print("|-----|-------|--------|----------------|--------------|----------------|------------|-------|")
-
-    for pr in prs:
-        rt = pr.get('response_times', {})
-        print(f"| [{pr.get('number', '')}]({pr.get('url', '')}) "
-              f"| {truncate(pr.get('title', ''), 35)} "
-              f"| {pr.get('author', '')} "
-              f"| {format_hours(rt.get('first_response_hours'))} "
-              f"| {format_hours(rt.get('first_review_hours'))} "
-              f"| {format_hours(rt.get('first_approval_hours'))} "
-              f"| {format_hours(pr.get('time_to_merge_hours'))} "
-              f"| {pr.get('total_lines_changed', 'N/A')} |")
+    # Build the whole table and write it once rather than one print() per row
+    lines = [
+        "| PR# | Title | Author | First Response | First Review | First Approval | Total Time | Lines |",
+        "|-----|-------|--------|----------------|--------------|----------------|------------|-------|",
+    ]
+
+    # Fields missing from the input are None on the PR records
+    for pr, (response, review, approval, total) in zip(prs, format_hour_columns(prs)):
+        lines.append(f"| [{'' if pr.number is None else pr.number}]({pr.url or ''}) "
+                     f"| {truncate(pr.title, 35)} "
+                     f"| {pr.author or ''} "
+                     f"| {response} "
+                     f"| {review} "
+                     f"| {approval} "
+                     f"| {total} "
+                     f"| {'N/A' if pr.total_lines_changed is None else pr.total_lines_changed} |")
+
+    lines.append('')
+    sys.stdout.write('\n'.join(lines))
 
 
 def print_text_table(prs):
@@ -248,51 +480,61 @@ def print_text_table(prs):
         'lines': 8
     }
 
-    header = (
-        f"{'PR#':<{widths['number']}} "
-        f"{'Title':<{widths['title']}} "
-        f"{'Author':<{widths['author']}} "
-        f"{'First Resp':<{widths['first_resp']}} "
-        f"{'First Rev':<{widths['first_rev']}} "
-        f"{'First App':<{widths['first_app']}} "
-        f"{'Total Time':<{widths['total']}} "
-        f"{'Lines':<{widths['lines']}}"
+    # Build the row format once; the widths don't change from row to row
+    row_fmt = ' '.join(
+        f"{{:<{widths[column]}}}"
+        for column in ('number', 'title', 'author', 'first_resp', 'first_rev', 'first_app', 'total', 'lines')
     )
+    title_width = widths['title']
+    author_width = widths['author']
 
-    print(header)
-    print("-" * len(header))
-
-    for pr in prs:
-        rt = pr.get('response_times', {})
-        row = (
-            f"{pr.get('number', 'N/A'):<{widths['number']}} "
-            f"{truncate(pr.get('title', ''), widths['title']):<{widths['title']}} "
-            f"{truncate(pr.get('author', ''), widths['author']):<{widths['author']}} "
-            f"{format_hours(rt.get('first_response_hours')):<{widths['first_resp']}} "
-            f"{format_hours(rt.get('first_review_hours')):<{widths['first_rev']}} "
-            f"{format_hours(rt.get('first_approval_hours')):<{widths['first_app']}} "
-            f"{format_hours(pr.get('time_to_merge_hours')):<{widths['total']}} "
-            f"{pr.get('total_lines_changed', 'N/A'):<{widths['lines']}}"
-        )
-        print(row)
+    header = row_fmt.format(
+        'PR#', 'Title', 'Author', 'First Resp', 'First Rev', 'First App', 'Total Time', 'Lines'
+    )
 
-    # Summary
-    valid_response_times = [pr['response_times']['first_response_hours']
-                           for pr in prs
-                           if pr.get('response_times', {}).get('first_response_hours') is not None]
+    # Build the whole table and write it once rather than one print() per row.
+    # The same pass keeps a running count/total/min/max of the known response
+    # times for the summary, so the PRs are only walked once.
+    lines = [header, "-" * len(header)]
+    responded = 0
+    total_response = 0.0
+    fastest = slowest = None
+
+    for pr, hour_cells in zip(prs, format_hour_columns(prs)):
+        hours = pr.first_response_hours
+        if hours is not None:
+            responded += 1
+            total_response += hours
+            if fastest is None or hours < fastest:
+                fastest = hours
+            if slowest is None or hours > slowest:
+                slowest = hours
+
+        # Fields missing from the input are None, which str.format can't
+        # pad; they are shown as N/A
+        lines.append(row_fmt.format(
+            'N/A' if pr.number is None else pr.number,
+            truncate(pr.title, title_width),
+            truncate(pr.author, author_width),
+            *hour_cells,
+            'N/A' if pr.total_lines_changed is None else pr.total_lines_changed,
+        ))
+
+    lines.append('')
+    sys.stdout.write('\n'.join(lines))
 
-    if valid_response_times:
+    # Summary
+    if responded:
+        average = total_response / responded
         print("\n" + "=" * len(header))
         print(f"Total PRs: {len(prs)}")
-        print(f"Fastest first response: {format_hours(min(valid_response_times))} ({min(valid_response_times):.2f} hours)")
-        print(f"Slowest first response: {format_hours(max(valid_response_times))} ({max(valid_response_times):.2f} hours)")
-        print(f"Average first response: {format_hours(sum(valid_response_times)/len(valid_response_times))} ({sum(valid_response_times)/len(valid_response_times):.2f} hours)")
+        print(f"Fastest first response: {format_hours(fastest)} ({fastest:.2f} hours)")
+        print(f"Slowest first response: {format_hours(slowest)} ({slowest:.2f} hours)")
+        print(f"Average first response: {format_hours(average)} ({average:.2f} hours)")
 
 
 def main():
     """Main entry point."""
-    import argparse
-
     parser = argparse.ArgumentParser(
         description='Sort PRs by time to first response (review, comment, or approval)'
     )
@@ -324,6 +566,11 @@ def main():
         type=int,
         help='Limit number of results'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-read the input file instead of using the cached parse from a previous run'
+    )
 
     args = parser.parse_args()
 
@@ -331,19 +578,21 @@ def main():
         print(f"Error: Input file '{args.input_file}' not found", file=sys.stderr)
         sys.exit(1)
 
-    # Read input
-    with open(args.input_file, 'r') as f:
-        data = json.load(f)
+    # Read input and enrich with response times from the JSON data; reruns
+    # on an unchanged file load the enriched list from the cache
+    def load_enriched_prs(path):
+        return enrich_prs_with_response_times(load_pull_requests(path))
 
-    prs = data.get('pull_requests', [])
+    if args.no_cache:
+        enriched_prs = load_enriched_prs(args.input_file)
+    else:
+        enriched_prs = load_cached(args.input_file, load_enriched_prs)
 
-    if not prs:
+    if not enriched_prs:
         print("Error: No PRs found in input file", file=sys.stderr)
         sys.exit(1)
 
-    # Enrich with response times from the JSON data
-    print(f"Processing {len(prs)} PRs with response time data...", file=sys.stderr)
-    enriched_prs = enrich_prs_with_response_times(prs)
+    print(f"Processing {len(enriched_prs)} PRs with response time data...", file=sys.stderr)
 
     # Print table
     print_table(enriched_prs, args.sort, args.ascending, args.format, args.limit)
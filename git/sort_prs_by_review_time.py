@@ -3,12 +3,121 @@
 Sort PRs from results.json by review time (time_to_merge_hours).
 """
 
+import argparse
+import hashlib
 import json
+import mmap
+import os
+import pickle
 import sys
+from operator import itemgetter, methodcaller
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def sort_prs_by_review_time(input_file, output_file=None, descending=True):
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Files larger than this are parsed incrementally with ijson (when installed)
+# so the raw text is never held in memory next to the parsed objects
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Parsed results are pickled here between runs (see load_cached); the cache
+# lives under the user's home rather than /tmp so nobody else can plant a pickle
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pr_sort')
+
+# Part of the cache key; bump when the cached objects change shape
+CACHE_FORMAT = 1
+
+
+def parse_json_file(f):
+    """
+    Parse an open JSON file with orjson straight from a read-only memory map.
+
+    The parser reads the mapped pages directly, so the raw text is never
+    copied into a bytes object; without orjson the stdlib parser reads it.
+    """
+    if not orjson or os.fstat(f.fileno()).st_size == 0:
+        return json.load(f)
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def load_results(path):
+    """
+    Load a results file into a dict.
+
+    Large files are streamed with ijson, building one top-level value at a
+    time; otherwise the whole file is parsed at once (with orjson when
+    available).
+    """
+    with open(path, 'rb') as f:
+        if ijson and os.fstat(f.fileno()).st_size > STREAM_THRESHOLD_BYTES:
+            return dict(ijson.kvitems(f, '', use_float=True))
+        return parse_json_file(f)
+
+
+def load_cached(path, loader):
+    """
+    Return loader(path), memoized on disk across runs.
+
+    The pickle is keyed by this script, the loader, CACHE_FORMAT and the
+    input's absolute path, and stores the file's mtime and size alongside
+    the result, so any change to the input rebuilds it. Bump CACHE_FORMAT
+    whenever what the loader returns changes. This function is copied
+    verbatim into each of the sort_prs_by_*.py scripts; keep them identical.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = f"{os.path.basename(__file__)}:{loader.__qualname__}:{CACHE_FORMAT}:{path}"
+    cache_file = os.path.join(CACHE_DIR, hashlib.sha256(key.encode()).hexdigest() + '.pkl')
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_stamp, result = pickle.load(f)
+        if cached_stamp == stamp:
+            return result
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError, ImportError):
+        pass
+
+    result = loader(path)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((stamp, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Caching is best effort; a read-only home directory just means no speed-up
+        pass
+    return result
+
+
+def write_indented(data, f):
+    """
+    Write data to the binary file f as 2-space indented JSON.
+
+    orjson serializes the whole document in C and it is written in one call;
+    without it the stdlib encoder's chunks are written as they are produced
+    rather than joined into one large string first.
+    """
+    if orjson:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    for chunk in json.JSONEncoder(indent=2).iterencode(data):
+        f.write(chunk.encode('ascii'))
+
+
+def sort_prs_by_review_time(input_file, output_file=None, descending=True, use_cache=True):
     """
     Sort pull requests by review time.
 
@@ -16,51 +125,69 @@ def sort_prs_by_review_time(input_file, output_file=None, descending=True):
         input_file: Path to the input JSON file
         output_file: Path to the output JSON file (optional, defaults to stdout)
         descending: Sort in descending order (longest review time first) if True
+        use_cache: Reuse the parsed input from a previous run if the file is unchanged
     """
     # Read the input file
-    with open(input_file, 'r') as f:
-        data = json.load(f)
+    data = load_cached(input_file, load_results) if use_cache else load_results(input_file)
 
     # Get the pull requests
     pull_requests = data.get('pull_requests', [])
 
-    # Sort by time_to_merge_hours
-    # Handle None values by treating them as negative infinity (they'll go to the end)
-    sorted_prs = sorted(
-        pull_requests,
-        key=lambda pr: pr.get('time_to_merge_hours') if pr.get('time_to_merge_hours') is not None else float('-inf'),
-        reverse=descending
-    )
+    # Sort by time_to_merge_hours using precomputed (key, index) pairs, so
+    # Timsort compares plain tuples instead of calling a lambda per PR.
+    # Descending order negates the key rather than reversing, which keeps
+    # tied PRs in input order; unmerged PRs (None) always go to the end.
+    # The column is pulled out with methodcaller and the PRs put back in
+    # order with itemgetter, so neither step runs Python code per PR.
+    sign = -1 if descending else 1
+    inf = float('inf')
+    hours_column = map(methodcaller('get', 'time_to_merge_hours'), pull_requests)
+    keyed = [(inf if hours is None else sign * hours, i) for i, hours in enumerate(hours_column)]
+    keyed.sort()
+    sorted_prs = list(map(pull_requests.__getitem__, map(itemgetter(1), keyed)))
 
     # Update the data with sorted PRs
     data['pull_requests'] = sorted_prs
 
     # Output the results
     if output_file:
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(output_file, 'wb') as f:
+            write_indented(data, f)
         print(f"Sorted {len(sorted_prs)} PRs by review time. Output written to {output_file}")
     else:
         # Print to stdout
-        json.dump(data, sys.stdout, indent=2)
+        sys.stdout.flush()
+        write_indented(data, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
         print(file=sys.stderr)  # Add newline to stderr
         print(f"Sorted {len(sorted_prs)} PRs by review time.", file=sys.stderr)
 
     # Print summary statistics
-    merged_prs = [pr for pr in sorted_prs if pr.get('time_to_merge_hours') is not None]
-    if merged_prs:
-        times = [pr['time_to_merge_hours'] for pr in merged_prs]
+    # One pass over the merged PRs collects everything the summary needs
+    merged_count = 0
+    total_time = 0.0
+    longest_pr = shortest_time = None
+    for pr in sorted_prs:
+        hours = pr.get('time_to_merge_hours')
+        if hours is None:
+            continue
+        merged_count += 1
+        total_time += hours
+        if longest_pr is None or hours > longest_pr['time_to_merge_hours']:
+            longest_pr = pr
+        if shortest_time is None or hours < shortest_time:
+            shortest_time = hours
+
+    if merged_count:
         print(f"\nReview Time Statistics:", file=sys.stderr)
-        print(f"  Total merged PRs: {len(merged_prs)}", file=sys.stderr)
-        print(f"  Longest review time: {max(times):.2f} hours (PR #{merged_prs[0]['number']})", file=sys.stderr)
-        print(f"  Shortest review time: {min(times):.2f} hours", file=sys.stderr)
-        print(f"  Average review time: {sum(times)/len(times):.2f} hours", file=sys.stderr)
+        print(f"  Total merged PRs: {merged_count}", file=sys.stderr)
+        print(f"  Longest review time: {longest_pr['time_to_merge_hours']:.2f} hours (PR #{longest_pr['number']})", file=sys.stderr)
+        print(f"  Shortest review time: {shortest_time:.2f} hours", file=sys.stderr)
+        print(f"  Average review time: {total_time/merged_count:.2f} hours", file=sys.stderr)
 
 
 def main():
     """Main entry point for the script."""
-    import argparse
-
     parser = argparse.ArgumentParser(
         description='Sort pull requests by review time (time_to_merge_hours)'
     )
@@ -79,6 +206,11 @@ def main():
         action='store_true',
         help='Sort in ascending order (shortest review time first)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-read the input file instead of using the cached parse from a previous run'
+    )
 
     args = parser.parse_args()
 
@@ -91,7 +223,8 @@ def main():
     sort_prs_by_review_time(
         args.input_file,
         args.output,
-        descending=not args.ascending
+        descending=not args.ascending,
+        use_cache=not args.no_cache
     )
 
 
@@ -3,16 +3,107 @@
 Sort and analyze PRs from results.json by various size metrics.
 """
 
+import hashlib
+import heapq
 import json
+import mmap
+import os
+import pickle
+import sys
 import argparse
 from typing import List, Dict, Any
-from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def load_pr_data(filename: str = 'results.json') -> Dict[str, Any]:
-    """Load PR data from JSON file."""
-    with open(filename, 'r') as f:
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Files larger than this are parsed incrementally with ijson (when installed)
+# so the raw text is never held in memory next to the parsed objects
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Parsed results are pickled here between runs (see load_cached); the cache
+# lives under the user's home rather than /tmp so nobody else can plant a pickle
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pr_sort')
+
+# Part of the cache key; bump when the cached objects change shape
+CACHE_FORMAT = 1
+
+# Parse errors from whichever parser load_pr_data() ends up using
+# (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
+
+
+def parse_json_file(f) -> Any:
+    """
+    Parse an open JSON file with orjson straight from a read-only memory map.
+
+    The parser reads the mapped pages directly, so the raw text is never
+    copied into a bytes object; without orjson the stdlib parser reads it.
+    """
+    if not orjson or os.fstat(f.fileno()).st_size == 0:
         return json.load(f)
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def load_pr_data(filename: str = 'results.json') -> Dict[str, Any]:
+    """
+    Load PR data from JSON file.
+
+    Large files are streamed with ijson, building one top-level value at a
+    time; otherwise the whole file is parsed at once (with orjson when
+    available).
+    """
+    with open(filename, 'rb') as f:
+        if ijson and os.fstat(f.fileno()).st_size > STREAM_THRESHOLD_BYTES:
+            return dict(ijson.kvitems(f, '', use_float=True))
+        return parse_json_file(f)
+
+
+def load_cached(path: str, loader) -> Any:
+    """
+    Return loader(path), memoized on disk across runs.
+
+    The pickle is keyed by this script, the loader, CACHE_FORMAT and the
+    input's absolute path, and stores the file's mtime and size alongside
+    the result, so any change to the input rebuilds it. Bump CACHE_FORMAT
+    whenever what the loader returns changes. This function is copied
+    verbatim into each of the sort_prs_by_*.py scripts; keep them identical.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = f"{os.path.basename(__file__)}:{loader.__qualname__}:{CACHE_FORMAT}:{path}"
+    cache_file = os.path.join(CACHE_DIR, hashlib.sha256(key.encode()).hexdigest() + '.pkl')
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_stamp, result = pickle.load(f)
+        if cached_stamp == stamp:
+            return result
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError, ImportError):
+        pass
+
+    result = loader(path)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((stamp, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Caching is best effort; a read-only home directory just means no speed-up
+        pass
+    return result
 
 
 def format_number(num: int) -> str:
@@ -50,9 +141,12 @@ def print_pr_summary(prs: List[Dict[str, Any]], sort_by: str, limit: int = None)
 
     metric_header = metric_headers.get(sort_by, 'Metric')
 
-    # Print header
-    print(f"\n{'Rank':<6} {'PR #':<8} {metric_header:<12} {'Files':<8} {'State':<10} {'Author':<20} {'Title'}")
-    print("=" * 150)
+    # Build the header and all rows, then write them in one go rather than
+    # one print() per PR
+    lines = [
+        f"\n{'Rank':<6} {'PR #':<8} {metric_header:<12} {'Files':<8} {'State':<10} {'Author':<20} {'Title'}",
+        "=" * 150,
+    ]
 
     # Print each PR
     prs_to_show = prs[:limit] if limit else prs
@@ -72,19 +166,29 @@ def print_pr_summary(prs: List[Dict[str, Any]], sort_by: str, limit: int = None)
         author = pr['author'][:18]  # Truncate if too long
         title = pr['title'][:80]  # Truncate title
 
-        print(f"{i:<6} {pr_num:<8} {metric_display:<12} {files:<8} {state:<10} {author:<20} {title}")
+        lines.append(f"{i:<6} {pr_num:<8} {metric_display:<12} {files:<8} {state:<10} {author:<20} {title}")
+
+    lines.append('')
+    sys.stdout.write('\n'.join(lines))
 
 
 def print_statistics(prs: List[Dict[str, Any]], data: Dict[str, Any]):
     """Print overall statistics."""
     total_prs = len(prs)
-    merged_prs = len([pr for pr in prs if pr['state'] == 'MERGED'])
-    closed_prs = len([pr for pr in prs if pr['state'] == 'CLOSED'])
+    merged_prs = closed_prs = 0
+    total_lines = total_additions = total_deletions = total_files = 0
 
-    total_lines = sum(pr['total_lines_changed'] for pr in prs)
-    total_additions = sum(pr['additions'] for pr in prs)
-    total_deletions = sum(pr['deletions'] for pr in prs)
-    total_files = sum(pr['changed_files'] for pr in prs)
+    # Accumulate every total in a single pass over the PRs
+    for pr in prs:
+        state = pr['state']
+        if state == 'MERGED':
+            merged_prs += 1
+        elif state == 'CLOSED':
+            closed_prs += 1
+        total_lines += pr['total_lines_changed']
+        total_additions += pr['additions']
+        total_deletions += pr['deletions']
+        total_files += pr['changed_files']
 
     avg_lines = total_lines / total_prs if total_prs > 0 else 0
     avg_files = total_files / total_prs if total_prs > 0 else 0
@@ -166,35 +270,47 @@ Examples:
         '--author',
         help='Filter by author name'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-read the input file instead of using the cached parse from a previous run'
+    )
 
     args = parser.parse_args()
 
     # Load data
     try:
-        data = load_pr_data(args.file)
+        data = load_pr_data(args.file) if args.no_cache else load_cached(args.file, load_pr_data)
     except FileNotFoundError:
         print(f"Error: File '{args.file}' not found")
         return 1
-    except json.JSONDecodeError:
+    except JSON_ERRORS:
         print(f"Error: File '{args.file}' is not valid JSON")
         return 1
 
     prs = data['pull_requests']
 
-    # Apply filters
+    # Apply filters before any sorting so dropped PRs cost nothing further
     if args.merged_only:
         prs = [pr for pr in prs if pr['state'] == 'MERGED']
 
     if args.author:
-        prs = [pr for pr in prs if args.author.lower() in pr['author'].lower()]
+        needle = args.author.lower()
+        prs = [pr for pr in prs if needle in pr['author'].lower()]
 
-    # Sort PRs
+    # Sort PRs by index over the metric column, extracted once
     # Handle None values for metrics that might be null (like time_to_merge_hours for non-merged PRs)
-    sorted_prs = sorted(
-        prs,
-        key=lambda x: x[args.sort] if x[args.sort] is not None else -1,
-        reverse=not args.reverse
-    )
+    column = [pr[args.sort] for pr in prs]
+    column = [-1 if value is None else value for value in column]
+    indexes = range(len(prs))
+    if args.limit and 0 < args.limit < len(prs) // 4:
+        # Only the top k (--limit) are displayed, so select them with a heap
+        # (O(n log k)) instead of sorting everything; ties keep sort order
+        select = heapq.nsmallest if args.reverse else heapq.nlargest
+        order = select(args.limit, indexes, key=column.__getitem__)
+    else:
+        order = sorted(indexes, key=column.__getitem__, reverse=not args.reverse)
+    sorted_prs = [prs[i] for i in order]
 
     # Print statistics
     if not args.no_stats:
@@ -204,8 +320,8 @@ Examples:
     print_pr_summary(sorted_prs, args.sort, args.limit)
 
     # Print summary at bottom
-    displayed = args.limit if args.limit and args.limit < len(sorted_prs) else len(sorted_prs)
-    print(f"\nShowing {displayed} of {len(sorted_prs)} PRs (sorted by {args.sort}, {'ascending' if args.reverse else 'descending'})")
+    displayed = args.limit if args.limit and args.limit < len(prs) else len(prs)
+    print(f"\nShowing {displayed} of {len(prs)} PRs (sorted by {args.sort}, {'ascending' if args.reverse else 'descending'})")
 
     return 0
 
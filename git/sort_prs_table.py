@@ -3,10 +3,57 @@
 Sort PRs from results.json by review time and display in table format.
 """
 
+import heapq
 import json
+import mmap
+import os
 import sys
 from pathlib import Path
-from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Files larger than this are parsed incrementally with ijson (when installed)
+# so the raw text is never held in memory next to the parsed objects
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+
+def parse_json_file(f):
+    """
+    Parse an open JSON file with orjson straight from a read-only memory map.
+
+    The parser reads the mapped pages directly, so the raw text is never
+    copied into a bytes object; without orjson the stdlib parser reads it.
+    """
+    if not orjson or os.fstat(f.fileno()).st_size == 0:
+        return json.load(f)
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def load_pull_requests(path):
+    """
+    Load the pull_requests list from a results file.
+
+    Large files are streamed one PR object at a time with ijson, so the rest
+    of the document is never built; otherwise the whole file is parsed at
+    once (with orjson when available).
+    """
+    with open(path, 'rb') as f:
+        if ijson and os.fstat(f.fileno()).st_size > STREAM_THRESHOLD_BYTES:
+            return list(ijson.items(f, 'pull_requests.item', use_float=True))
+        data = parse_json_file(f)
+    return data.get('pull_requests', [])
 
 
 def format_hours(hours):
@@ -27,11 +74,9 @@ def format_date(date_str):
     """Format ISO date string to shorter format."""
     if not date_str:
         return "N/A"
-    try:
-        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        return dt.strftime('%Y-%m-%d')
-    except:
-        return date_str[:10]
+    # The date part of an ISO 8601 timestamp is already YYYY-MM-DD, so there
+    # is nothing to gain from parsing it (the old fallback sliced it anyway)
+    return date_str[:10]
 
 
 def truncate(text, length=50):
@@ -41,7 +86,24 @@ def truncate(text, length=50):
     return text[:length-3] + "..."
 
 
-def print_table(prs, format_type='text', sort_by='review_time', ascending=False, show_closed=False):
+# Sort option -> (PR field, value used when the field is missing or null).
+# PRs without a merge time sort last in the default descending review-time
+# order; PRs without a response time sort last when ascending.
+SORT_KEYS = {
+    'review_time': ('time_to_merge_hours', float('-inf')),
+    'first_response': ('time_to_first_response_hours', float('inf')),
+    'first_comment': ('time_to_first_comment_hours', float('inf')),
+    'first_review': ('time_to_first_review_hours', float('inf')),
+    'first_approval': ('time_to_first_approval_hours', float('inf')),
+    'number': ('number', 0),
+    'created': ('created_at', ''),
+    'size': ('total_lines_changed', 0),
+    'reviews': ('review_count', 0),
+}
+
+
+def print_table(prs, format_type='text', sort_by='review_time', ascending=False, show_closed=False,
+                limit=None):
     """
     Print PRs in table format.
 
@@ -51,27 +113,35 @@ def print_table(prs, format_type='text', sort_by='review_time', ascending=False,
         sort_by: Field to sort by
         ascending: Sort order
         show_closed: Include closed (unmerged) PRs
+        limit: Only print the first N PRs in sorted order
     """
-    # Filter PRs based on show_closed flag
-    if not show_closed:
-        filtered_prs = [pr for pr in prs if pr.get('state') == 'MERGED']
+    # Filter PRs based on show_closed flag and extract the sort column in
+    # the same pass (missing values take the field's sentinel); the PR
+    # indexes are then sorted by that column, so no Python key function
+    # runs per comparison.
+    field, missing = SORT_KEYS.get(sort_by, SORT_KEYS['review_time'])
+    filtered_prs = []
+    column = []
+    for pr in prs:
+        get = pr.get
+        if not show_closed and get('state') != 'MERGED':
+            continue
+        value = get(field)
+        filtered_prs.append(pr)
+        column.append(missing if value is None else value)
+
+    indexes = range(len(filtered_prs))
+    if limit and limit > 0:
+        # Only the top N are printed, so select them with a bounded heap
+        # (same result as sorting and slicing, without sorting everything)
+        select = heapq.nsmallest if ascending else heapq.nlargest
+        order = select(limit, indexes, key=column.__getitem__)
     else:
-        filtered_prs = prs
-
-    # Sort PRs
-    sort_keys = {
-        'review_time': lambda pr: pr.get('time_to_merge_hours') if pr.get('time_to_merge_hours') is not None else float('-inf'),
-        'first_response': lambda pr: pr.get('time_to_first_response_hours') if pr.get('time_to_first_response_hours') is not None else float('inf'),
-        'first_comment': lambda pr: pr.get('time_to_first_comment_hours') if pr.get('time_to_first_comment_hours') is not None else float('inf'),
-        'first_review': lambda pr: pr.get('time_to_first_review_hours') if pr.get('time_to_first_review_hours') is not None else float('inf'),
-        'first_approval': lambda pr: pr.get('time_to_first_approval_hours') if pr.get('time_to_first_approval_hours') is not None else float('inf'),
-        'number': lambda pr: pr.get('number', 0),
-        'created': lambda pr: pr.get('created_at', ''),
-        'size': lambda pr: pr.get('total_lines_changed', 0),
-        'reviews': lambda pr: pr.get('review_count', 0),
-    }
-
-    sorted_prs = sorted(filtered_prs, key=sort_keys.get(sort_by, sort_keys['review_time']), reverse=not ascending)
+        order = sorted(indexes, key=column.__getitem__, reverse=not ascending)
+        # A negative limit slices as it always did (all but the last N)
+        if limit:
+            order = order[:limit]
+    sorted_prs = [filtered_prs[i] for i in order]
 
     if format_type == 'csv':
         print_csv(sorted_prs)
@@ -81,10 +151,31 @@ def print_table(prs, format_type='text', sort_by='review_time', ascending=False,
         print_text_table(sorted_prs)
 
 
+def csv_row(pr):
+    """Return the CSV columns for one PR."""
+    get = pr.get
+    return (
+        get('number', ''),
+        get('title', ''),
+        get('author', ''),
+        get('state', ''),
+        get('time_to_first_response_hours', ''),
+        get('time_to_first_comment_hours', ''),
+        get('time_to_first_review_hours', ''),
+        get('time_to_first_approval_hours', ''),
+        get('time_to_merge_hours', ''),
+        format_date(get('created_at')),
+        format_date(get('merged_at')),
+        get('total_lines_changed', ''),
+        get('review_count', ''),
+        get('approvals', ''),
+        get('url', '')
+    )
+
+
 def print_csv(prs):
     """Print PRs in CSV format."""
     import csv
-    import sys
 
     writer = csv.writer(sys.stdout)
 
@@ -95,112 +186,128 @@ def print_csv(prs):
         'Created', 'Merged', 'Lines Changed', 'Reviews', 'Approvals', 'URL'
     ])
 
-    # Data rows
-    for pr in prs:
-        writer.writerow([
-            pr.get('number', ''),
-            pr.get('title', ''),
-            pr.get('author', ''),
-            pr.get('state', ''),
-            pr.get('time_to_first_response_hours', ''),
-            pr.get('time_to_first_comment_hours', ''),
-            pr.get('time_to_first_review_hours', ''),
-            pr.get('time_to_first_approval_hours', ''),
-            pr.get('time_to_merge_hours', ''),
-            format_date(pr.get('created_at')),
-            format_date(pr.get('merged_at')),
-            pr.get('total_lines_changed', ''),
-            pr.get('review_count', ''),
-            pr.get('approvals', ''),
-            pr.get('url', '')
-        ])
+    # Data rows, handed to the csv module in one writerows() call
+    writer.writerows(map(csv_row, prs))
 
 
 def print_markdown(prs):
     """Print PRs in Markdown table format."""
-    # Header
-    print("| PR# | Title | Author | First Resp | First Rev | First App | Total Time | Lines | Reviews |")
-    print("|-----|-------|--------|------------|-----------|-----------|------------|-------|---------|")
+    # Build the whole table and write it once rather than one print() per row
+    lines = [
+        "| PR# | Title | Author | First Resp | First Rev | First App | Total Time | Lines | Reviews |",
+        "|-----|-------|--------|------------|-----------|-----------|------------|-------|---------|",
+    ]
 
-    # Data rows
     for pr in prs:
-        print(f"| [{pr.get('number', '')}]({pr.get('url', '')}) "
-              f"| {truncate(pr.get('title', ''), 35)} "
-              f"| {pr.get('author', '')} "
-              f"| {format_hours(pr.get('time_to_first_response_hours'))} "
-              f"| {format_hours(pr.get('time_to_first_review_hours'))} "
-              f"| {format_hours(pr.get('time_to_first_approval_hours'))} "
-              f"| {format_hours(pr.get('time_to_merge_hours'))} "
-              f"| {pr.get('total_lines_changed', 'N/A')} "
-              f"| {pr.get('review_count', 'N/A')} |")
+        get = pr.get
+        title = get('title', '')
+        if len(title) > 35:
+            title = truncate(title, 35)
+        lines.append(f"| [{get('number', '')}]({get('url', '')}) "
+                     f"| {title} "
+                     f"| {get('author', '')} "
+                     f"| {format_hours(get('time_to_first_response_hours'))} "
+                     f"| {format_hours(get('time_to_first_review_hours'))} "
+                     f"| {format_hours(get('time_to_first_approval_hours'))} "
+                     f"| {format_hours(get('time_to_merge_hours'))} "
+                     f"| {get('total_lines_changed', 'N/A')} "
+                     f"| {get('review_count', 'N/A')} |")
+
+    lines.append('')
+    sys.stdout.write('\n'.join(lines))
+
+
+# Plain text table columns: (heading, width)
+TEXT_COLUMNS = (
+    ('PR#', 6),
+    ('Title', 45),
+    ('Author', 18),
+    ('First Resp', 11),
+    ('First Rev', 10),
+    ('First App', 10),
+    ('Total Time', 11),
+    ('Lines', 8),
+    ('Reviews', 8),
+)
+TEXT_WIDTHS = tuple(width for _, width in TEXT_COLUMNS)
+# The header never changes, so it is formatted once at import
+TEXT_HEADER = ' '.join(heading.ljust(width) for heading, width in TEXT_COLUMNS)
 
 
 def print_text_table(prs):
     """Print PRs in plain text table format."""
-    # Column widths
-    widths = {
-        'number': 6,
-        'title': 45,
-        'author': 18,
-        'first_resp': 11,
-        'first_rev': 10,
-        'first_app': 10,
-        'total': 11,
-        'lines': 8,
-        'reviews': 8
-    }
+    # Build the whole table and write it once rather than one print() per row.
+    # Cells are padded with str.ljust against widths unpacked into locals,
+    # which avoids parsing a format spec for every cell.
+    (w_number, w_title, w_author, w_first_resp, w_first_rev, w_first_app,
+     w_total, w_lines, w_reviews) = TEXT_WIDTHS
+    header = TEXT_HEADER
+    lines = [header, "-" * len(header)]
 
-    # Header
-    header = (
-        f"{'PR#':<{widths['number']}} "
-        f"{'Title':<{widths['title']}} "
-        f"{'Author':<{widths['author']}} "
-        f"{'First Resp':<{widths['first_resp']}} "
-        f"{'First Rev':<{widths['first_rev']}} "
-        f"{'First App':<{widths['first_app']}} "
-        f"{'Total Time':<{widths['total']}} "
-        f"{'Lines':<{widths['lines']}} "
-        f"{'Reviews':<{widths['reviews']}}"
-    )
-
-    print(header)
-    print("-" * len(header))
-
-    # Data rows
     for pr in prs:
-        row = (
-            f"{pr.get('number', 'N/A'):<{widths['number']}} "
-            f"{truncate(pr.get('title', ''), widths['title']):<{widths['title']}} "
-            f"{truncate(pr.get('author', ''), widths['author']):<{widths['author']}} "
-            f"{format_hours(pr.get('time_to_first_response_hours')):<{widths['first_resp']}} "
-            f"{format_hours(pr.get('time_to_first_review_hours')):<{widths['first_rev']}} "
-            f"{format_hours(pr.get('time_to_first_approval_hours')):<{widths['first_app']}} "
-            f"{format_hours(pr.get('time_to_merge_hours')):<{widths['total']}} "
-            f"{pr.get('total_lines_changed', 'N/A'):<{widths['lines']}} "
-            f"{pr.get('review_count', 'N/A'):<{widths['reviews']}}"
-        )
-        print(row)
-
-    # Summary statistics
-    merged_prs = [pr for pr in prs if pr.get('time_to_merge_hours') is not None]
-    prs_with_response = [pr for pr in prs if pr.get('time_to_first_response_hours') is not None]
+        get = pr.get
+        # Most titles and authors fit, so only long ones pay for a truncate() call
+        title = get('title', '')
+        if len(title) > w_title:
+            title = truncate(title, w_title)
+        author = get('author', '')
+        if len(author) > w_author:
+            author = truncate(author, w_author)
+        lines.append(' '.join((
+            str(get('number', 'N/A')).ljust(w_number),
+            title.ljust(w_title),
+            author.ljust(w_author),
+            format_hours(get('time_to_first_response_hours')).ljust(w_first_resp),
+            format_hours(get('time_to_first_review_hours')).ljust(w_first_rev),
+            format_hours(get('time_to_first_approval_hours')).ljust(w_first_app),
+            format_hours(get('time_to_merge_hours')).ljust(w_total),
+            str(get('total_lines_changed', 'N/A')).ljust(w_lines),
+            str(get('review_count', 'N/A')).ljust(w_reviews),
+        )))
+
+    lines.append('')
+    sys.stdout.write('\n'.join(lines))
+
+    # Summary statistics, gathered in one pass as running count/total/min/max
+    # rather than collecting the times into lists and scanning each of them
+    # three more times
+    merged_count = response_count = 0
+    total_merge = total_response = 0.0
+    longest = shortest = fastest = slowest = None
+    for pr in prs:
+        hours = pr.get('time_to_merge_hours')
+        if hours is not None:
+            merged_count += 1
+            total_merge += hours
+            if longest is None or hours > longest:
+                longest = hours
+            if shortest is None or hours < shortest:
+                shortest = hours
+        hours = pr.get('time_to_first_response_hours')
+        if hours is not None:
+            response_count += 1
+            total_response += hours
+            if fastest is None or hours < fastest:
+                fastest = hours
+            if slowest is None or hours > slowest:
+                slowest = hours
 
     print("\n" + "=" * len(header))
-    print(f"Total PRs: {len(prs)} (Merged: {len(merged_prs)})")
+    print(f"Total PRs: {len(prs)} (Merged: {merged_count})")
 
-    if merged_prs:
-        times = [pr['time_to_merge_hours'] for pr in merged_prs]
+    if merged_count:
+        average = total_merge / merged_count
         print(f"\nTotal Time to Merge:")
-        print(f"  Longest: {format_hours(max(times))} ({max(times):.2f} hours)")
-        print(f"  Shortest: {format_hours(min(times))} ({min(times):.2f} hours)")
-        print(f"  Average: {format_hours(sum(times)/len(times))} ({sum(times)/len(times):.2f} hours)")
+        print(f"  Longest: {format_hours(longest)} ({longest:.2f} hours)")
+        print(f"  Shortest: {format_hours(shortest)} ({shortest:.2f} hours)")
+        print(f"  Average: {format_hours(average)} ({average:.2f} hours)")
 
-    if prs_with_response:
-        response_times = [pr['time_to_first_response_hours'] for pr in prs_with_response]
+    if response_count:
+        average = total_response / response_count
         print(f"\nTime to First Response:")
-        print(f"  Fastest: {format_hours(min(response_times))} ({min(response_times):.2f} hours)")
-        print(f"  Slowest: {format_hours(max(response_times))} ({max(response_times):.2f} hours)")
-        print(f"  Average: {format_hours(sum(response_times)/len(response_times))} ({sum(response_times)/len(response_times):.2f} hours)")
+        print(f"  Fastest: {format_hours(fastest)} ({fastest:.2f} hours)")
+        print(f"  Slowest: {format_hours(slowest)} ({slowest:.2f} hours)")
+        print(f"  Average: {format_hours(average)} ({average:.2f} hours)")
 
 
 def main():
@@ -251,19 +358,11 @@ def main():
         print(f"Error: Input file '{args.input_file}' not found", file=sys.stderr)
         sys.exit(1)
 
-    # Read the input file
-    with open(args.input_file, 'r') as f:
-        data = json.load(f)
-
-    # Get the pull requests
-    prs = data.get('pull_requests', [])
-
-    # Limit results if specified
-    if args.limit:
-        prs = prs[:args.limit]
+    # Read the pull requests from the input file
+    prs = load_pull_requests(args.input_file)
 
-    # Print the table
-    print_table(prs, args.format, args.sort, args.ascending, args.show_closed)
+    # Print the table; --limit applies to the filtered, sorted PRs
+    print_table(prs, args.format, args.sort, args.ascending, args.show_closed, args.limit)
 
 
 if __name__ == '__main__':
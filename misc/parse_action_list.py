@@ -34,35 +34,145 @@ Examples:
     ./parse_action_list.py --help
 """
 
+import argparse
+import io
+import mmap
+import os
 import re
 import sys
-import subprocess
-from typing import List, Tuple, Dict, Optional
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Callable, List, Tuple, Dict, Optional, TextIO
 from datetime import datetime
 
 
-def print_help():
-    """Print help message."""
-    print(__doc__)
-    sys.exit(0)
+# Logs at least this big get their independent whole-file scans run in
+# parallel worker processes; below it process start-up isn't worth paying
+PARALLEL_MIN_BYTES = 64 << 20
+
+# Patterns applied to every matched log line, compiled once up front
+_TS_RE = re.compile(r'\[(\d{2}:\d{2}:\d{2})\]', re.ASCII)
+# Format: "action: N ~ Current list - X/Y; Action no. - Z; Action - ACTION; target - TARGET; value - VALUE;"
+_ACTION_RE = re.compile(
+    r'action: (\d+) ~ Current list - (\d+)/(\d+); '
+    r'Action no\. - (\d+); '
+    r'Action - ([^;]+); '
+    r'target - ([^;]*); '
+    r'value - ([^;]*);',
+    re.ASCII
+)
+_ACTION_NUM_RE = re.compile(r'action: (\d+) ~', re.ASCII)
+_KEYED_LIST_RE = re.compile(r'\{(\w+)\s+([^\}]+)\}')
+_MIN_EXPECTED_RE = re.compile(r'Minimum Expected:\s+(\d+)\s+\(actual\s+(\d+)\)', re.ASCII)
+_PUB_CLIENT_RE = re.compile(r'P2: -name (c_vmrRedundancyRandomActions_pub_\w+)')
+_SUB_CLIENT_RE = re.compile(r'P2: -name (c_vmrRedundancyRandomActions_sub_\w+)')
+
+
+def _xml_int_re(tag: str):
+    """Compile a pattern capturing the integer in <tag>N</tag>."""
+    return re.compile(fr'<{tag}>(\d+)</{tag}>', re.ASCII)
+
+
+def _xml_tags_re(tags: Dict[str, str]):
+    """
+    Compile one pattern matching <tag>N</tag> for any of the given tags.
+
+    Group 1 is the tag (look it up in tags for the short key), group 2 the
+    integer; a single search per line replaces one search per tag.
+    """
+    names = '|'.join(map(re.escape, tags))
+    return re.compile(fr'<({names})>(\d+)</\1>', re.ASCII)
+
+
+# XML tag -> block key, for the message-spool and per-publisher sections
+_SPOOL_TAGS = {'ingress-messages': 'ingress',
+               'egress-messages': 'egress',
+               'total-discarded-messages': 'discards'}
+_SPOOL_TAGS_RE = _xml_tags_re(_SPOOL_TAGS)
+_PUB_CLIENT_TAGS = {'last-message-id-sent': 'last_msg_id',
+                    'guaranteed-messages': 'sent'}
+_PUB_CLIENT_TAGS_RE = _xml_tags_re(_PUB_CLIENT_TAGS)
+_CONFIRMED_DELIVERED_RE = _xml_int_re('message-confirmed-delivered')
+
+
+def _line_ts(line: str) -> Optional[str]:
+    """
+    Return the first [HH:MM:SS] timestamp in line, or None.
+
+    AFW lines normally start with the timestamp, so that position is checked
+    by slicing first and _TS_RE only runs for lines that don't.
+    """
+    if (line[:1] == '[' and line[9:10] == ']'
+            and line[3:4] == ':' and line[6:7] == ':'):
+        digits = line[1:3] + line[4:6] + line[7:9]
+        if digits.isascii() and digits.isdigit():
+            return line[1:9]
+    ts_match = _TS_RE.search(line)
+    return ts_match.group(1) if ts_match else None
+
+
+def _scan_log_lines(log_file: str, needle: bytes, then: bytes = b'',
+                    after: int = 0) -> List[str]:
+    """
+    Return the log lines containing needle, like grep.
+
+    If then is given, the line must also contain it after needle (grep -E
+    'needle.*then'); after adds that many lines of trailing context, with
+    "--" between non-adjacent groups (grep -A).  The file is memory-mapped and
+    searched as bytes, so only the matching lines are ever decoded.
+
+    Raises FileNotFoundError if log_file does not exist.
+    """
+    with open(log_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            lines = []
+            emitted_to = -1  # offset of the first line not yet output
+            pos = mm.find(needle)
+            while pos != -1:
+                start = mm.rfind(b'\n', 0, pos) + 1
+                line_end = mm.find(b'\n', pos)
+                if line_end == -1:
+                    line_end = size
+
+                if not then or mm.find(then, pos + len(needle), line_end) != -1:
+                    # The match line plus `after` lines of context
+                    window_end = line_end
+                    for _ in range(after):
+                        if window_end + 1 >= size:
+                            break
+                        next_end = mm.find(b'\n', window_end + 1)
+                        window_end = size if next_end == -1 else next_end
+
+                    if start >= emitted_to:
+                        if after and emitted_to != -1 and start > emitted_to:
+                            lines.append('--')
+                    else:
+                        # Overlaps the previous context window; just extend it
+                        start = emitted_to
+                    if window_end >= start:
+                        for line in mm[start:window_end].decode('utf-8', 'replace').split('\n'):
+                            lines.append(line[:-1] if line.endswith('\r') else line)
+                        emitted_to = window_end + 1
+
+                pos = mm.find(needle, line_end)
+            return lines
 
 
 def extract_action_lists(log_file: str) -> List[Tuple[str, str, str]]:
     """
-    Extract action lists from log file using grep.
+    Extract action lists from log file.
 
     Returns list of tuples: (timestamp, full_timestamp_line, action_list_text)
     """
     try:
-        # Use grep to find "Action list" entries with 2 lines of context after
-        result = subprocess.run(
-            ['grep', 'Action list', log_file, '-A', '2'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        lines = result.stdout.strip().split('\n')
+        # Find "Action list" entries with 2 lines of context after
+        lines = _scan_log_lines(log_file, b'Action list', after=2)
         action_lists = []
 
         i = 0
@@ -72,8 +182,7 @@ def extract_action_lists(log_file: str) -> List[Tuple[str, str, str]]:
             # Look for timestamp line with "Action list:"
             if 'Action list:' in line:
                 # Extract timestamp [HH:MM:SS]
-                timestamp_match = re.search(r'\[(\d{2}:\d{2}:\d{2})\]', line)
-                timestamp = timestamp_match.group(1) if timestamp_match else "Unknown"
+                timestamp = _line_ts(line) or "Unknown"
 
                 # Skip the "------------" separator line
                 i += 1
@@ -81,75 +190,66 @@ def extract_action_lists(log_file: str) -> List[Tuple[str, str, str]]:
                     i += 1
 
                 # Get the action list content (may span multiple lines until next separator)
-                action_text = ""
+                parts = []
                 while i < len(lines) and lines[i] != '--':
-                    if lines[i].strip():
-                        action_text += lines[i].strip() + " "
+                    part = lines[i].strip()
+                    if part:
+                        parts.append(part)
                     i += 1
 
-                if action_text.strip():
-                    action_lists.append((timestamp, line, action_text.strip()))
+                if parts:
+                    action_lists.append((timestamp, line, ' '.join(parts)))
 
             i += 1
 
         return action_lists
 
-    except subprocess.CalledProcessError as e:
-        print(f"Error running grep: {e}", file=sys.stderr)
-        return []
     except FileNotFoundError:
         print(f"Error: Log file '{log_file}' not found", file=sys.stderr)
         return []
 
 
-def extract_executed_actions(log_file: str) -> List[Tuple[str, Dict[str, str]]]:
+def extract_executed_actions(
+        log_file: str, wanted_list: Optional[int] = None
+) -> List[Tuple[str, Dict[str, str]]]:
     """
     Extract executed actions from the test log.
 
+    If wanted_list is given, only actions from that list are returned; lines
+    for other lists are dropped before they are parsed.
+
     Returns list of tuples: (timestamp, action_dict)
     """
+    list_tag = f'Current list - {wanted_list}/' if wanted_list is not None else None
     try:
-        # Grep for "Start of action" lines
-        result = subprocess.run(
-            ['grep', '-E', 'Start of action:.*Action -', log_file],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
+        # Find "Start of action" lines
         executed = []
-        for line in result.stdout.strip().split('\n'):
-            # Extract timestamp
-            ts_match = re.search(r'\[(\d{2}:\d{2}:\d{2})\]', line)
-            timestamp = ts_match.group(1) if ts_match else "Unknown"
-
-            # Parse action details
-            # Format: "action: N ~ Current list - X/Y; Action no. - Z; Action - ACTION; target - TARGET; value - VALUE;"
-            action_match = re.search(
-                r'action: (\d+) ~ Current list - (\d+)/(\d+); '
-                r'Action no\. - (\d+); '
-                r'Action - ([^;]+); '
-                r'target - ([^;]*); '
-                r'value - ([^;]*);',
-                line
-            )
+        for line in _scan_log_lines(log_file, b'Start of action:', then=b'Action -'):
+            if list_tag is not None and list_tag not in line:
+                continue
 
-            if action_match:
-                executed.append((timestamp, {
-                    'global_num': int(action_match.group(1)),
-                    'list_num': int(action_match.group(2)),
-                    'total_lists': int(action_match.group(3)),
-                    'action_num': int(action_match.group(4)),
-                    'action': action_match.group(5).strip(),
-                    'target': action_match.group(6).strip(),
-                    'value': action_match.group(7).strip()
-                }))
+            # Parse action details; lines that don't parse need no timestamp
+            action_match = _ACTION_RE.search(line)
+            if not action_match:
+                continue
+
+            # Extract timestamp
+            timestamp = _line_ts(line) or "Unknown"
+
+            global_num, list_num, total_lists, action_num, action, target, value = \
+                action_match.groups()
+            executed.append((timestamp, {
+                'global_num': int(global_num),
+                'list_num': int(list_num),
+                'total_lists': int(total_lists),
+                'action_num': int(action_num),
+                'action': action.strip(),
+                'target': target.strip(),
+                'value': value.strip()
+            }))
 
         return executed
 
-    except subprocess.CalledProcessError:
-        print("No executed actions found in log file.", file=sys.stderr)
-        return []
     except FileNotFoundError:
         print(f"Error: Log file '{log_file}' not found", file=sys.stderr)
         return []
@@ -158,7 +258,7 @@ def extract_executed_actions(log_file: str) -> List[Tuple[str, Dict[str, str]]]:
 def _parse_keyed_list(line: str) -> Dict[str, any]:
     """Parse a Tcl keyed list like {rc OK} {txMsgs 240} {txMsgRate 99.17}."""
     result = {}
-    for key, value in re.findall(r'\{(\w+)\s+([^\}]+)\}', line):
+    for key, value in _KEYED_LIST_RE.findall(line):
         try:
             result[key] = float(value) if '.' in value else int(value)
         except ValueError:
@@ -166,7 +266,56 @@ def _parse_keyed_list(line: str) -> Dict[str, any]:
     return result
 
 
-def extract_traffic_blocks(log_file: str) -> List[Dict]:
+@dataclass
+class TrafficBlock:
+    """
+    One traffic validation block (one verifyHaStateAndTraffic call).
+
+    The optional sections stay None until their marker is seen in the block.
+    Slotted since a long soak log holds many blocks; the slots are listed by
+    hand because dataclass(slots=True) needs Python 3.10.
+    """
+    __slots__ = (
+        'anchor_ts', 'pub_stats_after', 'sub_stats_after', 'validation',
+        'msg_spool', 'pub_clients_after', 'sub_clients_after',
+    )
+
+    anchor_ts: str
+    pub_stats_after: Optional[Dict]
+    sub_stats_after: Optional[Dict]
+    validation: Optional[Dict]
+    msg_spool: Optional[Dict[str, int]]
+    pub_clients_after: Dict[str, Dict[str, int]]
+    sub_clients_after: Dict[str, Dict[str, int]]
+
+
+def _open_from_first(log_file: str, needle: bytes):
+    """
+    Open log_file as text, positioned at the first line containing needle.
+
+    The file is memory-mapped to find that line, so everything before it is
+    skipped without being decoded; if needle never occurs, an empty stream is
+    returned.  Raises FileNotFoundError if log_file does not exist.
+    """
+    raw = open(log_file, 'rb', buffering=1 << 20)
+    try:
+        start = -1
+        if os.fstat(raw.fileno()).st_size:
+            with mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = mm.find(needle)
+                if pos != -1:
+                    start = mm.rfind(b'\n', 0, pos) + 1
+        if start == -1:
+            raw.close()
+            return io.StringIO()
+        raw.seek(start)
+        return io.TextIOWrapper(raw)
+    except BaseException:
+        raw.close()
+        raise
+
+
+def extract_traffic_blocks(log_file: str) -> List[TrafficBlock]:
     """
     Extract traffic validation blocks from the log file.
 
@@ -177,113 +326,109 @@ def extract_traffic_blocks(log_file: str) -> List[Dict]:
     are direct deltas (no subtraction needed).  Per-publisher broker
     guaranteed-messages after the clear equals msgs sent during the interval.
 
-    Returns a list of block dicts containing:
-      anchor_ts, pub_stats_after, sub_stats_after, validation,
-      msg_spool, pub_clients_after, sub_clients_after
+    Returns a list of TrafficBlock records, in log order.
     """
     blocks = []
     current_block = None
     section = None
+    # Stats dicts of the client whose section is being read, if any
     cur_pub = None
     cur_sub = None
 
     try:
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
-
-        for line in lines:
-            # New block starts at this marker
-            if 'Debug info before traffic validation' in line:
-                if current_block is not None:
-                    blocks.append(current_block)
-                ts_match = re.search(r'\[(\d{2}:\d{2}:\d{2})\]', line)
-                current_block = {
-                    'anchor_ts': ts_match.group(1) if ts_match else 'Unknown',
-                    'pub_clients_after': {},
-                    'sub_clients_after': {},
-                }
-                section = None
-                cur_pub = None
-                cur_sub = None
-                continue
-
-            if current_block is None:
-                continue
-
-            # Single-line SDK stats (highest priority — check before section routing)
-            if 'Publisher client-side stats after ValidateMessageStreamsAtObject:' in line:
-                current_block['pub_stats_after'] = _parse_keyed_list(line)
-                section = None
-                continue
-            if 'Subscriber client-side stats after ValidateMessageStreamsAtObject:' in line:
-                current_block['sub_stats_after'] = _parse_keyed_list(line)
-                section = None
-                continue
-
-            # Validation result (first occurrence per block)
-            if 'Minimum Expected:' in line and 'validation' not in current_block:
-                m = re.search(r'Minimum Expected:\s+(\d+)\s+\(actual\s+(\d+)\)', line)
-                if m:
-                    exp, act = int(m.group(1)), int(m.group(2))
-                    current_block['validation'] = {
-                        'expected': exp,
-                        'actual': act,
-                        'passed': act >= exp,
-                    }
-                continue
-
-            # Section markers
-            if 'Message-spool stats after traffic validation:' in line:
-                section = 'spool'
-                current_block.setdefault('msg_spool', {})
-                continue
-            if 'Publisher client message-spool-stats after traffic validation:' in line:
-                section = 'pub_broker'
-                cur_pub = None
-                continue
-            if 'Subscriber client message-spool-stats after traffic validation:' in line:
-                section = 'sub_broker'
-                cur_sub = None
-                continue
-            if 'Debug info after traffic validation' in line:
-                section = None
-                continue
+        # Stream the log line by line (through a 1 MiB buffer) rather than
+        # reading it all into a list first; only the current block is kept.
+        # Nothing before the first block matters, so start reading there.
+        with _open_from_first(log_file, b'Debug info before traffic validation') as f:
+            for line in f:
+                # Every marker checked below contains one of these substrings,
+                # so each line is scanned for them once and only the markers
+                # of the families present are tested; a line with none of
+                # them only matters as content of a stats section
+                tv = 'traffic validation' in line
+                vms = 'ValidateMessageStreamsAtObject' in line
+                me = 'Minimum Expected' in line
+                if not (tv or vms or me or section):
+                    continue
+
+                # New block starts at this marker
+                if tv and 'Debug info before traffic validation' in line:
+                    if current_block is not None:
+                        blocks.append(current_block)
+                    current_block = TrafficBlock(
+                        _line_ts(line) or 'Unknown', None, None, None, None, {}, {}
+                    )
+                    section = None
+                    cur_pub = None
+                    cur_sub = None
+                    continue
+
+                if current_block is None:
+                    continue
+
+                # Single-line SDK stats (highest priority — check before section routing)
+                if vms and 'Publisher client-side stats after ValidateMessageStreamsAtObject:' in line:
+                    current_block.pub_stats_after = _parse_keyed_list(line)
+                    section = None
+                    continue
+                if vms and 'Subscriber client-side stats after ValidateMessageStreamsAtObject:' in line:
+                    current_block.sub_stats_after = _parse_keyed_list(line)
+                    section = None
+                    continue
+
+                # Validation result (first occurrence per block)
+                if me and 'Minimum Expected:' in line and current_block.validation is None:
+                    m = _MIN_EXPECTED_RE.search(line)
+                    if m:
+                        exp, act = int(m.group(1)), int(m.group(2))
+                        current_block.validation = {
+                            'expected': exp,
+                            'actual': act,
+                            'passed': act >= exp,
+                        }
+                    continue
+
+                # Section markers
+                if tv and 'Message-spool stats after traffic validation:' in line:
+                    section = 'spool'
+                    if current_block.msg_spool is None:
+                        current_block.msg_spool = {}
+                    continue
+                if tv and 'Publisher client message-spool-stats after traffic validation:' in line:
+                    section = 'pub_broker'
+                    cur_pub = None
+                    continue
+                if tv and 'Subscriber client message-spool-stats after traffic validation:' in line:
+                    section = 'sub_broker'
+                    cur_sub = None
+                    continue
+                if tv and 'Debug info after traffic validation' in line:
+                    section = None
+                    continue
+
+                # Section-specific XML parsing
+                if section == 'spool':
+                    m = _SPOOL_TAGS_RE.search(line)
+                    if m:
+                        current_block.msg_spool[_SPOOL_TAGS[m.group(1)]] = int(m.group(2))
 
-            # Section-specific XML parsing
-            if section == 'spool':
-                for tag, key in [('ingress-messages', 'ingress'),
-                                  ('egress-messages', 'egress'),
-                                  ('total-discarded-messages', 'discards')]:
-                    m = re.search(fr'<{tag}>(\d+)</{tag}>', line)
+                elif section == 'pub_broker':
+                    m = _PUB_CLIENT_RE.search(line)
                     if m:
-                        current_block['msg_spool'][key] = int(m.group(1))
-                        break
-
-            elif section == 'pub_broker':
-                m = re.search(r'P2: -name (c_vmrRedundancyRandomActions_pub_\w+)', line)
-                if m:
-                    cur_pub = m.group(1)
-                    current_block['pub_clients_after'].setdefault(cur_pub, {})
-                elif cur_pub:
-                    for tag, key in [('last-message-id-sent', 'last_msg_id'),
-                                     ('guaranteed-messages', 'sent')]:
-                        m = re.search(fr'<{tag}>(\d+)</{tag}>', line)
+                        cur_pub = current_block.pub_clients_after.setdefault(m.group(1), {})
+                    elif cur_pub is not None:
+                        m = _PUB_CLIENT_TAGS_RE.search(line)
                         if m:
-                            current_block['pub_clients_after'][cur_pub][key] = int(m.group(1))
-                            break
+                            cur_pub[_PUB_CLIENT_TAGS[m.group(1)]] = int(m.group(2))
 
-            elif section == 'sub_broker':
-                m = re.search(r'P2: -name (c_vmrRedundancyRandomActions_sub_\w+)', line)
-                if m:
-                    cur_sub = m.group(1)
-                    current_block['sub_clients_after'].setdefault(cur_sub, {})
-                elif cur_sub:
-                    m = re.search(
-                        r'<message-confirmed-delivered>(\d+)</message-confirmed-delivered>',
-                        line)
+                elif section == 'sub_broker':
+                    m = _SUB_CLIENT_RE.search(line)
                     if m:
-                        current_block['sub_clients_after'][cur_sub][
-                            'confirmed_delivered'] = int(m.group(1))
+                        cur_sub = current_block.sub_clients_after.setdefault(m.group(1), {})
+                    elif cur_sub is not None:
+                        m = _CONFIRMED_DELIVERED_RE.search(line)
+                        if m:
+                            cur_sub['confirmed_delivered'] = int(m.group(1))
 
         if current_block is not None:
             blocks.append(current_block)
@@ -322,13 +467,14 @@ def parse_actions(action_text: str) -> List[Dict[str, str]]:
     return actions
 
 
-def format_action_list_compact(timestamp: str, actions: List[Dict[str, str]]) -> str:
-    """Format actions in compact list-by-list view."""
+def write_action_list_compact(
+        out: TextIO, timestamp: str, actions: List[Dict[str, str]]) -> None:
+    """Write actions to out in compact list-by-list view."""
 
-    output = []
-    output.append(f"\n{'='*80}")
-    output.append(f"Action List at {timestamp}")
-    output.append(f"{'='*80}\n")
+    write = out.write
+    write(f"\n{'='*80}\n")
+    write(f"Action List at {timestamp}\n")
+    write(f"{'='*80}\n\n")
 
     list_num = 1
     current_list = []
@@ -341,11 +487,11 @@ def format_action_list_compact(timestamp: str, actions: List[Dict[str, str]]) ->
         if action_name == 'check':
             # Output the current list
             if current_list:
-                output.append(f"List {list_num} → check::{value}")
-                output.append("-" * 60)
+                write(f"List {list_num} → check::{value}\n")
+                write("-" * 60 + "\n")
                 for i, act_str in enumerate(current_list, 1):
-                    output.append(f"  {i:2d}. {act_str}")
-                output.append("")
+                    write(f"  {i:2d}. {act_str}\n")
+                write("\n")
                 current_list = []
                 list_num += 1
         else:
@@ -361,12 +507,10 @@ def format_action_list_compact(timestamp: str, actions: List[Dict[str, str]]) ->
 
     # Handle any remaining actions
     if current_list:
-        output.append(f"List {list_num} (incomplete)")
-        output.append("-" * 60)
+        write(f"List {list_num} (incomplete)\n")
+        write("-" * 60 + "\n")
         for i, act_str in enumerate(current_list, 1):
-            output.append(f"  {i:2d}. {act_str}")
-
-    return '\n'.join(output)
+            write(f"  {i:2d}. {act_str}\n")
 
 
 def extract_end_time_entries(log_file: str) -> List[Tuple[str, int]]:
@@ -374,26 +518,17 @@ def extract_end_time_entries(log_file: str) -> List[Tuple[str, int]]:
     Extract end action entries as (timestamp, global_num) pairs in log order.
     """
     try:
-        result = subprocess.run(
-            ['grep', '-E', 'End of action:.*Action -', log_file],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
         entries = []
-        for line in result.stdout.strip().split('\n'):
-            ts_match = re.search(r'\[(\d{2}:\d{2}:\d{2})\]', line)
-            if not ts_match:
+        for line in _scan_log_lines(log_file, b'End of action:', then=b'Action -'):
+            timestamp = _line_ts(line)
+            if not timestamp:
                 continue
-            action_match = re.search(r'action: (\d+) ~', line)
+            action_match = _ACTION_NUM_RE.search(line)
             if action_match:
-                entries.append((ts_match.group(1), int(action_match.group(1))))
+                entries.append((timestamp, int(action_match.group(1))))
 
         return entries
 
-    except subprocess.CalledProcessError:
-        return []
     except FileNotFoundError:
         print(f"Error: Log file '{log_file}' not found", file=sys.stderr)
         return []
@@ -457,23 +592,34 @@ def split_end_times_into_runs(
 
     result = []
     for bucket in run_buckets:
-        grouped: Dict[int, List[str]] = {}
+        # [end_first, end_last, first_secs, last_secs]; each timestamp is
+        # converted once instead of on every comparison
+        grouped: Dict[int, List] = {}
         for ts, global_num in bucket:
-            if global_num not in grouped:
-                grouped[global_num] = [ts, ts]
+            secs = ts_to_seconds(ts)
+            entry = grouped.get(global_num)
+            if entry is None:
+                grouped[global_num] = [ts, ts, secs, secs]
             else:
-                entry = grouped[global_num]
-                if ts_to_seconds(ts) < ts_to_seconds(entry[0]):
+                if secs < entry[2]:
                     entry[0] = ts
-                if ts_to_seconds(ts) > ts_to_seconds(entry[1]):
+                    entry[2] = secs
+                if secs > entry[3]:
                     entry[1] = ts
+                    entry[3] = secs
         result.append({k: (v[0], v[1]) for k, v in grouped.items()})
 
     return result
 
 
+@lru_cache(maxsize=None)
 def ts_to_seconds(ts: str) -> int:
-    """Convert HH:MM:SS timestamp to seconds since midnight."""
+    """
+    Convert HH:MM:SS timestamp to seconds since midnight.
+
+    Cached: a log repeats the same second on many lines and there are at most
+    86400 distinct values, so the cache stays small.
+    """
     h, m, s = map(int, ts.split(':'))
     return h * 3600 + m * 60 + s
 
@@ -499,58 +645,73 @@ def group_run_entries(
 
     Returns list of tuples: (start_first, start_last, action_dict)
     """
+    # [start_first, start_last, action, first_secs, last_secs]; seconds are
+    # None while the timestamp is still "Unknown"
     seen: Dict[int, List] = {}
 
     for timestamp, action in run:
         global_num = action['global_num']
-
-        if global_num not in seen:
-            seen[global_num] = [timestamp, timestamp, action]
-        elif timestamp != "Unknown":
-            entry = seen[global_num]
-            if entry[0] == "Unknown":
-                entry[0] = timestamp
-                entry[1] = timestamp
+        secs = ts_to_seconds(timestamp) if timestamp != "Unknown" else None
+
+        entry = seen.get(global_num)
+        if entry is None:
+            seen[global_num] = [timestamp, timestamp, action, secs, secs]
+        elif secs is not None:
+            if entry[3] is None:
+                entry[0] = entry[1] = timestamp
+                entry[3] = entry[4] = secs
             else:
-                if ts_to_seconds(timestamp) < ts_to_seconds(entry[0]):
+                if secs < entry[3]:
                     entry[0] = timestamp
-                if ts_to_seconds(timestamp) > ts_to_seconds(entry[1]):
+                    entry[3] = secs
+                if secs > entry[4]:
                     entry[1] = timestamp
+                    entry[4] = secs
 
     return [(e[0], e[1], e[2]) for e in (seen[k] for k in sorted(seen.keys()))]
 
 
-def format_executed_actions(
+def write_executed_actions(
+        out: TextIO,
         executed: List[Tuple[str, Dict[str, str]]],
-        traffic_blocks: List[Dict] = None,
-        end_times_per_run: List[Dict[int, Tuple[str, str]]] = None) -> str:
-    """Format executed actions grouped by list and run."""
+        traffic_blocks: List[TrafficBlock] = None,
+        end_times_per_run: List[Dict[int, Tuple[str, str]]] = None) -> None:
+    """
+    Write executed actions to out, grouped by list and run.
+
+    Lines are written as they are formatted rather than collected and joined,
+    so a long timeline is never held in memory as one string.
+    """
+    write = out.write
 
     if not executed:
-        return "No executed actions found."
+        write("No executed actions found.\n")
+        return
 
     runs = split_into_runs(executed)
+    # Group each run once; the check pre-pass and the output loop share it
+    grouped_runs = [group_run_entries(run) for run in runs]
 
-    output = []
-    output.append(f"\n{'='*80}")
-    output.append(f"Executed Actions Timeline ({len(runs)} run(s))")
-    output.append(f"{'='*80}\n")
+    write(f"\n{'='*80}\n")
+    write(f"Executed Actions Timeline ({len(runs)} run(s))\n")
+    write(f"{'='*80}\n\n")
 
     # Pre-collect check start times (in run/action order) for range-based matching
     all_check_starts = []
+    block_index = None
     if traffic_blocks:
-        for run in runs:
-            for start_first, _, action in group_run_entries(run):
+        block_index = index_traffic_blocks(traffic_blocks)
+        for grouped in grouped_runs:
+            for start_first, _, action in grouped:
                 if action['action'] == 'check':
                     all_check_starts.append(start_first)
 
     check_idx = 0
 
-    for run_idx, run in enumerate(runs, 1):
+    for run_idx, grouped in enumerate(grouped_runs, 1):
         run_end_times = (end_times_per_run[run_idx - 1]
                          if end_times_per_run and run_idx - 1 < len(end_times_per_run)
                          else {})
-        grouped = group_run_entries(run)
         current_list = None
 
         for start_first, start_last, action in grouped:
@@ -561,9 +722,9 @@ def format_executed_actions(
 
             if current_list != list_num:
                 if current_list is not None:
-                    output.append("")
-                output.append(f"List {list_num}/{total_lists} [{run_idx}]")
-                output.append("-" * 60)
+                    write("\n")
+                write(f"List {list_num}/{total_lists} [{run_idx}]\n")
+                write("-" * 60 + "\n")
                 current_list = list_num
 
             action_name = action['action']
@@ -591,8 +752,8 @@ def format_executed_actions(
                 time_str = f"{start_str} → {end_str} ({duration})"
             else:
                 time_str = start_str
-            output.append(
-                f"  [{time_str}] #{global_num:3d} (Act {action_num:2d}): {desc}"
+            write(
+                f"  [{time_str}] #{global_num:3d} (Act {action_num:2d}): {desc}\n"
             )
 
             if action_name == 'check' and traffic_blocks:
@@ -600,66 +761,86 @@ def format_executed_actions(
                            if check_idx + 1 < len(all_check_starts)
                            else None)
                 blocks = find_traffic_blocks_for_check(
-                    start_first, next_ts, traffic_blocks
+                    start_first, next_ts, traffic_blocks, block_index
                 )
                 for block in blocks:
-                    output.append("")
-                    output.append(format_traffic_block(block))
+                    write("\n")
+                    write(format_traffic_block(block))
+                    write("\n")
                 check_idx += 1
 
         if run_idx < len(runs):
-            output.append("")
-
-    return '\n'.join(output)
+            write("\n")
 
 
 def find_traffic_blocks_for_check(
         check_ts: str,
         next_check_ts: Optional[str],
-        traffic_blocks: List[Dict],
-) -> List[Dict]:
+        traffic_blocks: List[TrafficBlock],
+        index: Optional[Tuple[List[int], List[int]]] = None,
+) -> List[TrafficBlock]:
     """
     Return traffic blocks whose anchor_ts falls in [check_ts, next_check_ts).
 
+    index is the result of index_traffic_blocks(traffic_blocks); pass it when
+    calling repeatedly so it is not rebuilt for every check.
+
     Each check action owns the blocks that started after it began and before
     the next check started.  This is reliable because verifyHaStateAndTraffic
     is called from within the check action and checks are spaced minutes apart.
     """
+    if index is None:
+        index = index_traffic_blocks(traffic_blocks)
+    secs, order = index
     check_secs = ts_to_seconds(check_ts)
     next_secs = ts_to_seconds(next_check_ts) if next_check_ts else 86400
-    return [b for b in traffic_blocks
-            if b['anchor_ts'] != 'Unknown'
-            and check_secs <= ts_to_seconds(b['anchor_ts']) < next_secs]
+    lo = bisect_left(secs, check_secs)
+    hi = bisect_left(secs, next_secs, lo)
+    # Back to log order, in case the anchors are not monotonic
+    return [traffic_blocks[i] for i in sorted(order[lo:hi])]
+
+
+def index_traffic_blocks(traffic_blocks: List[TrafficBlock]) -> Tuple[List[int], List[int]]:
+    """
+    Sort traffic blocks by anchor time for find_traffic_blocks_for_check.
+
+    Returns (anchor seconds ascending, matching block indexes); blocks with an
+    Unknown anchor are left out.  Built once so each check is a binary search
+    rather than a scan of every block.
+    """
+    keyed = sorted((ts_to_seconds(b.anchor_ts), i)
+                   for i, b in enumerate(traffic_blocks)
+                   if b.anchor_ts != 'Unknown')
+    return [k for k, _ in keyed], [i for _, i in keyed]
 
 
-def format_traffic_block(block: Dict) -> str:
+def format_traffic_block(block: TrafficBlock) -> str:
     """Format one traffic validation block (one verifyHaStateAndTraffic call)."""
     lines = []
-    ts = block.get('anchor_ts', 'Unknown')
-    lines.append(f"    Traffic Validation ({ts}):")
+    lines.append(f"    Traffic Validation ({block.anchor_ts}):")
 
     # Validation result
-    if 'validation' in block:
-        val = block['validation']
+    if block.validation is not None:
+        val = block.validation
         status = '✓' if val['passed'] else '✗'
         lines.append(f"      Validation: expected≥{val['expected']}, "
                      f"actual={val['actual']} {status}")
 
     # Publisher SDK stats — txMsgs is a direct delta (stats reset before block)
-    if 'pub_stats_after' in block:
-        pub = block['pub_stats_after']
+    if block.pub_stats_after is not None:
+        pub = block.pub_stats_after
         lines.append(f"      Pub SDK:    txMsgs={pub.get('txMsgs', 0)}, "
                      f"txRate={pub.get('txMsgRate', 0.0)} msg/s")
 
     # Subscriber SDK stats — rxMsgs is a direct delta (stats reset before block)
-    if 'sub_stats_after' in block:
-        sub = block['sub_stats_after']
+    if block.sub_stats_after is not None:
+        sub = block.sub_stats_after
         lines.append(f"      Sub SDK:    rxMsgs={sub.get('rxMsgs', 0)}, "
                      f"rxRate={sub.get('rxMsgRate', 0.0)} msg/s")
 
     # Per-publisher broker stats — guaranteed-messages = msgs sent since clear
-    if block.get('pub_clients_after'):
-        clients = block['pub_clients_after']
+    if block.pub_clients_after:
+        clients = block.pub_clients_after
         total = sum(c.get('sent', 0) for c in clients.values())
         lines.append(f"      Pub broker: {len(clients)} client(s), total_sent={total}")
         for name, stats in sorted(clients.items()):
@@ -668,8 +849,8 @@ def format_traffic_block(block: Dict) -> str:
                          f"last_id={stats.get('last_msg_id', 0)}")
 
     # Message-spool stats
-    if 'msg_spool' in block:
-        spool = block['msg_spool']
+    if block.msg_spool is not None:
+        spool = block.msg_spool
         lines.append(f"      Spool:      ingress={spool.get('ingress', 0)}, "
                      f"egress={spool.get('egress', 0)}, "
                      f"discards={spool.get('discards', 0)}")
@@ -677,28 +858,62 @@ def format_traffic_block(block: Dict) -> str:
     return '\n'.join(lines)
 
 
+def _extractor_pool(log_file: str):
+    """
+    Return a process pool for the side extractors if log_file is large
+    enough to be worth it, else a null context (run everything in-process).
+    """
+    try:
+        large = os.path.getsize(log_file) >= PARALLEL_MIN_BYTES
+    except OSError:
+        large = False
+    return ProcessPoolExecutor(max_workers=2) if large else nullcontext()
+
+
+def _start_extractors(pool: Optional[ProcessPoolExecutor], log_file: str,
+                      show_traffic: bool) -> Dict[str, Callable[[], object]]:
+    """
+    Start the whole-file scans that are independent of the executed actions.
+
+    Returns {name: getter}; with a pool each scan is submitted now and the
+    getter waits for its result, without one the getter runs the scan when
+    called, so the order of any error messages is unchanged.
+    """
+    extractors = {'end_times': extract_end_time_entries}
+    if show_traffic:
+        extractors['traffic_blocks'] = extract_traffic_blocks
+    if pool is None:
+        return {name: partial(fn, log_file) for name, fn in extractors.items()}
+    return {name: pool.submit(fn, log_file).result for name, fn in extractors.items()}
+
+
 def main():
-    # Parse command line arguments
-    log_file = '/tmp/debug/log.txt'
-    show_executed = False
-    show_traffic = False
-    filter_list = None
-
-    i = 1
-    while i < len(sys.argv):
-        arg = sys.argv[i]
-        if arg in ('--help', '-h'):
-            print_help()
-        elif arg == '--executed':
-            show_executed = True
-        elif arg == '--traffic':
-            show_traffic = True
-        elif arg == '--list' and i + 1 < len(sys.argv):
-            filter_list = int(sys.argv[i + 1])
-            i += 1
-        elif not arg.startswith('--'):
-            log_file = arg
-        i += 1
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "log_file", nargs="?", default="/tmp/debug/log.txt",
+        help="Path to AFW log file (default: /tmp/debug/log.txt)",
+    )
+    parser.add_argument(
+        "--executed", action="store_true",
+        help="Show executed actions from test output instead of declared action lists",
+    )
+    parser.add_argument(
+        "--list", type=int, default=None, metavar="N", dest="filter_list",
+        help="Show only list N (use with --executed)",
+    )
+    parser.add_argument(
+        "--traffic", action="store_true",
+        help="Show traffic validation stats after each CHECK action (use with --executed)",
+    )
+    args = parser.parse_args()
+
+    log_file = args.log_file
+    show_executed = args.executed
+    show_traffic = args.traffic
+    filter_list = args.filter_list
 
     print(f"Parsing actions from: {log_file}")
     mode_str = 'Executed actions' if show_executed else 'Declared action lists'
@@ -709,31 +924,33 @@ def main():
     print(f"Mode: {mode_str}\n")
 
     if show_executed:
-        # Extract and display executed actions
-        executed = extract_executed_actions(log_file)
-
-        if not executed:
-            print("No executed actions found in log file.")
-            return 1
-
-        # Filter by list if requested
-        if filter_list is not None:
-            executed = [(ts, act) for ts, act in executed if act['list_num'] == filter_list]
-
-        print(f"Found {len(executed)} executed action(s)\n")
-
-        # Extract traffic blocks if requested
-        traffic_blocks = None
-        if show_traffic:
-            print("Extracting traffic validation blocks...\n")
-            traffic_blocks = extract_traffic_blocks(log_file)
-            if traffic_blocks:
-                print(f"Found {len(traffic_blocks)} traffic validation block(s)\n")
-
-        end_times_per_run = split_end_times_into_runs(
-            extract_end_time_entries(log_file)
-        )
-        print(format_executed_actions(executed, traffic_blocks, end_times_per_run))
+        # On a large log the end-time and traffic scans run in worker
+        # processes while the executed actions are extracted here
+        with _extractor_pool(log_file) as pool:
+            pending = _start_extractors(pool, log_file, show_traffic)
+
+            # Extract and display executed actions
+            executed = extract_executed_actions(log_file, filter_list)
+
+            if not executed:
+                if filter_list is not None:
+                    print(f"No executed actions for list {filter_list} found in log file.")
+                else:
+                    print("No executed actions found in log file.")
+                return 1
+
+            print(f"Found {len(executed)} executed action(s)\n")
+
+            # Extract traffic blocks if requested
+            traffic_blocks = None
+            if show_traffic:
+                print("Extracting traffic validation blocks...\n")
+                traffic_blocks = pending['traffic_blocks']()
+                if traffic_blocks:
+                    print(f"Found {len(traffic_blocks)} traffic validation block(s)\n")
+
+            end_times_per_run = split_end_times_into_runs(pending['end_times']())
+        write_executed_actions(sys.stdout, executed, traffic_blocks, end_times_per_run)
 
     else:
         # Extract and display declared action lists
@@ -748,7 +965,7 @@ def main():
         # Process and display each action list
         for timestamp, full_line, action_text in action_lists:
             actions = parse_actions(action_text)
-            print(format_action_list_compact(timestamp, actions))
+            write_action_list_compact(sys.stdout, timestamp, actions)
 
     return 0
 
@@ -18,6 +18,25 @@ from datetime import datetime
 from typing import List, Tuple, Optional
 
 
+# Patterns applied to every log line, compiled once at import.
+# Pattern to match ActionStart lines with numbered actions
+# Example: [14:37:33] [11] [notice] [RESULT] [::L1::Test::ActionStart] { Method params: 1 ~ Prepare for action...
+_ACTION_START_RE = re.compile(
+    r'^\[(\d{2}:\d{2}:\d{2})\].*\[::L1::Test::ActionStart\].*Method params: (\d+) ~ (.*)$'
+)
+
+# Pattern to match ActionEnd
+_ACTION_END_RE = re.compile(
+    r'^\[(\d{2}:\d{2}:\d{2})\].*\[::L1::Test::ActionEnd\]'
+)
+
+# Pattern to extract date from log lines (appears at various points)
+# Example: Fri, 20 Feb 2026 15:58:36 -0500
+_DATE_RE = re.compile(
+    r'([A-Z][a-z]{2}, \d{2} [A-Z][a-z]{2} \d{4}) (\d{2}:\d{2}:\d{2})'
+)
+
+
 class Action:
     """Represents a single test action with start and optional end timestamp."""
 
@@ -75,23 +94,6 @@ def extract_actions(log_file_path: str) -> List[Action]:
     Returns:
         List of Action objects sorted by action number
     """
-    # Pattern to match ActionStart lines with numbered actions
-    # Example: [14:37:33] [11] [notice] [RESULT] [::L1::Test::ActionStart] { Method params: 1 ~ Prepare for action...
-    action_start_pattern = re.compile(
-        r'^\[(\d{2}:\d{2}:\d{2})\].*\[::L1::Test::ActionStart\].*Method params: (\d+) ~ (.*)$'
-    )
-
-    # Pattern to match ActionEnd
-    action_end_pattern = re.compile(
-        r'^\[(\d{2}:\d{2}:\d{2})\].*\[::L1::Test::ActionEnd\]'
-    )
-
-    # Pattern to extract date from log lines (appears at various points)
-    # Example: Fri, 20 Feb 2026 15:58:36 -0500
-    date_pattern = re.compile(
-        r'([A-Z][a-z]{2}, \d{2} [A-Z][a-z]{2} \d{4}) (\d{2}:\d{2}:\d{2})'
-    )
-
     actions = []
     current_date = None
     pending_action_start = None
@@ -100,12 +102,12 @@ def extract_actions(log_file_path: str) -> List[Action]:
         with open(log_file_path, 'r', encoding='utf-8', errors='ignore') as f:
             for line in f:
                 # Try to extract date if present in this line
-                date_match = date_pattern.search(line)
+                date_match = _DATE_RE.search(line)
                 if date_match:
                     current_date = date_match.group(1)
 
                 # Check for ActionStart
-                start_match = action_start_pattern.search(line)
+                start_match = _ACTION_START_RE.search(line)
                 if start_match:
                     start_time = start_match.group(1)
                     action_num = int(start_match.group(2))
@@ -125,7 +127,7 @@ def extract_actions(log_file_path: str) -> List[Action]:
                     continue
 
                 # Check for ActionEnd
-                end_match = action_end_pattern.search(line)
+                end_match = _ACTION_END_RE.search(line)
                 if end_match and pending_action_start:
                     end_time = end_match.group(1)
                     pending_action_start.set_end_time(end_time, current_date or "Unknown")
@@ -5,56 +5,70 @@ of a search string.
 """
 
 import argparse
+import mmap
 import sys
 
 
+def _count_lines(mm, end, chunk_size=1 << 20):
+    """Count the newlines in mm[:end], a chunk at a time."""
+    count = 0
+    for start in range(0, end, chunk_size):
+        count += mm[start:min(start + chunk_size, end)].count(b'\n')
+    return count
+
+
 def trim_file(file_path, search_string):
     """
     Remove lines before first occurrence and after last occurrence of
     search_string in the file.
 
+    The file is memory-mapped and searched with find/rfind, so only the
+    kept lines are ever copied out of it.
+
     Args:
         file_path: Path to the file to modify
         search_string: String to search for in each line
     """
+    needle = search_string.encode()
     try:
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
+        with open(file_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            first = mm.find(needle)
+            if first != -1:
+                last = mm.rfind(needle)
+                # Widen the match span to the full lines it falls on
+                start = mm.rfind(b'\n', 0, first) + 1
+                end = mm.find(b'\n', last)
+                end = len(mm) if end == -1 else end + 1
+                first_line = _count_lines(mm, start) + 1
+                trimmed = mm[start:end]
+    except ValueError:
+        # mmap refuses an empty file, which can't contain the string
+        first = -1
     except IOError as e:
         print(f"Error reading file: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Find first and last occurrence
-    first_index = None
-    last_index = None
-
-    for i, line in enumerate(lines):
-        if search_string in line:
-            if first_index is None:
-                first_index = i
-            last_index = i
-
-    if first_index is None:
+    if first == -1:
         print(
             f"String '{search_string}' not found in file",
             file=sys.stderr
         )
         sys.exit(1)
 
-    # Extract lines from first to last occurrence (inclusive)
-    trimmed_lines = lines[first_index:last_index + 1]
+    line_count = trimmed.count(b'\n') + (not trimmed.endswith(b'\n'))
 
     # Write back to file
     try:
-        with open(file_path, 'w') as f:
-            f.writelines(trimmed_lines)
+        with open(file_path, 'wb') as f:
+            f.write(trimmed)
     except IOError as e:
         print(f"Error writing file: {e}", file=sys.stderr)
         sys.exit(1)
 
     print(
-        f"Trimmed {file_path}: kept lines {first_index + 1} to "
-        f"{last_index + 1} ({len(trimmed_lines)} lines)"
+        f"Trimmed {file_path}: kept lines {first_line} to "
+        f"{first_line + line_count - 1} ({line_count} lines)"
     )
 
 
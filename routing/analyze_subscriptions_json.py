@@ -11,53 +11,146 @@ Outputs a summary file with counts of unique topics and totals per VPN.
 """
 
 import json
+import mmap
+import os
 import sys
 import argparse
 from collections import defaultdict
+from functools import partial
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def analyze_subscriptions(input_file, detailed=False):
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Topic prefixes of the two kinds of shared subscription
+SHARE_PREFIX = '#share/'
+NOEXPORT_SHARE_PREFIX = '#noexport/#share/'
+
+# Inputs larger than this are parsed incrementally with ijson (when installed)
+# so the whole subscription list is never built in memory
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+
+def parse_json_file(f):
     """
-    Analyze subscriptions from JSON file or stdin and print summary to stdout.
+    Parse an open JSON file with orjson straight from a read-only memory map.
 
-    Args:
-        input_file: Path to input JSON file, '-' for stdin, or None for stdin
-        detailed: If True, include detailed topic listings in output
+    The parser reads the mapped pages directly, so the raw text is never
+    copied into a bytes object; without orjson the stdlib parser reads it.
+    """
+    if not orjson or os.fstat(f.fileno()).st_size == 0:
+        return json.load(f)
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _stream_subscriptions(f):
+    """Yield the subscription entries from f one at a time as ijson parses them."""
+    with f:
+        try:
+            yield from ijson.items(f, 'subscriptions.item')
+        except ijson.JSONError as e:
+            print(f"Error parsing JSON file: {e}")
+            sys.exit(1)
+
+
+def load_subscriptions(input_file):
+    """
+    Return the subscription entries from a JSON file, or stdin for '-'/None.
+
+    A large regular file (or stdin redirected from one) is streamed with
+    ijson, one entry at a time; otherwise the whole input is parsed at once
+    (with orjson when available).  Exits with an error if it isn't valid JSON.
     """
-    # Parse JSON
     try:
         if input_file == '-' or input_file is None:
-            data = json.load(sys.stdin)
+            f = sys.stdin.buffer
         else:
-            with open(input_file, 'r') as f:
+            f = open(input_file, 'rb')
+        if ijson and os.fstat(f.fileno()).st_size > STREAM_THRESHOLD_BYTES:
+            return _stream_subscriptions(f)
+        with f:
+            if f is not sys.stdin.buffer:
+                data = parse_json_file(f)
+            elif orjson:
+                data = orjson.loads(f.read())
+            else:
                 data = json.load(f)
     except Exception as e:
         print(f"Error parsing JSON file: {e}")
         sys.exit(1)
 
+    return data.get('subscriptions', [])
+
+
+# Per-VPN subscription categories, keyed as in the VPN buckets
+CATEGORIES = ('share_topics', 'noexport_share_topics', 'other_topics')
+
+
+def _new_vpn_bucket(detailed):
+    """
+    Return the per-VPN topic counters, one per subscription category.
+
+    For the detailed listing they are plain dicts counted with get(): faster
+    here than defaultdict(int) or a __missing__ subclass, whose fallbacks cost
+    more on first-seen topics.  Otherwise only the number of distinct topics
+    is reported, so each category just records its topics as keys (a dict
+    takes less memory than a set of the same strings) and the counts are
+    kept as a running total per category under 'totals'.
+    """
+    bucket = {category: {} for category in CATEGORIES}
+    if detailed:
+        return bucket
+    bucket['totals'] = dict.fromkeys(CATEGORIES, 0)
+    return bucket
+
+
+def analyze_subscriptions(input_file, detailed=False):
+    """
+    Analyze subscriptions from JSON file or stdin and print summary to stdout.
+
+    Args:
+        input_file: Path to input JSON file, '-' for stdin, or None for stdin
+        detailed: If True, include detailed topic listings in output
+    """
     # Data structure to hold VPN subscription data
-    vpn_data = defaultdict(lambda: {
-        'share_topics': defaultdict(int),
-        'noexport_share_topics': defaultdict(int),
-        'other_topics': defaultdict(int)
-    })
+    vpn_data = defaultdict(partial(_new_vpn_bucket, detailed))
 
     # Process all subscription entries
-    subscriptions = data.get('subscriptions', [])
-
-    for subscription_entry in subscriptions:
+    for subscription_entry in load_subscriptions(input_file):
         vpn_name = subscription_entry.get('vpn_name')
         topic = subscription_entry.get('subscription')
 
         if vpn_name is None or topic is None:
             continue
 
-        if topic.startswith('#noexport/#share/'):
-            vpn_data[vpn_name]['noexport_share_topics'][topic] += 1
-        elif topic.startswith('#share/'):
-            vpn_data[vpn_name]['share_topics'][topic] += 1
+        # Both shared prefixes start with '#'; one character test settles
+        # most other topics without trying either prefix
+        if topic[:1] != '#':
+            category = 'other_topics'
+        elif topic.startswith(NOEXPORT_SHARE_PREFIX):
+            category = 'noexport_share_topics'
+        elif topic.startswith(SHARE_PREFIX):
+            category = 'share_topics'
         else:
-            vpn_data[vpn_name]['other_topics'][topic] += 1
+            category = 'other_topics'
+
+        bucket = vpn_data[vpn_name]
+        topics = bucket[category]
+        if detailed:
+            topics[topic] = topics.get(topic, 0) + 1
+        else:
+            topics[topic] = None
+            bucket['totals'][category] += 1
 
     # Calculate grand totals
     grand_total_share_unique = 0
@@ -66,110 +159,113 @@ def analyze_subscriptions(input_file, detailed=False):
     grand_total_noexport_share_count = 0
     grand_total_other_unique = 0
     grand_total_other_count = 0
-    grand_combined_shared_topics = defaultdict(int)
-
-    for vpn_name in vpn_data.keys():
-        data = vpn_data[vpn_name]
-        grand_total_share_unique += len(data['share_topics'])
-        grand_total_share_count += sum(data['share_topics'].values())
-        grand_total_noexport_share_unique += len(data['noexport_share_topics'])
-        grand_total_noexport_share_count += sum(data['noexport_share_topics'].values())
-        grand_total_other_unique += len(data['other_topics'])
-        grand_total_other_count += sum(data['other_topics'].values())
-
-        # Calculate combined shared for grand totals
-        for topic, count in data['share_topics'].items():
-            value_x = topic.replace('#share/', '', 1)
-            grand_combined_shared_topics[value_x] += count
-        for topic, count in data['noexport_share_topics'].items():
-            value_x = topic.replace('#noexport/#share/', '', 1)
-            grand_combined_shared_topics[value_x] += count
+    grand_combined_shared_topics = set()
+
+    for bucket in vpn_data.values():
+        if not detailed:
+            totals = bucket['totals']
+        else:
+            totals = {category: sum(bucket[category].values()) for category in CATEGORIES}
+            bucket['totals'] = totals
+        grand_total_share_unique += len(bucket['share_topics'])
+        grand_total_share_count += totals['share_topics']
+        grand_total_noexport_share_unique += len(bucket['noexport_share_topics'])
+        grand_total_noexport_share_count += totals['noexport_share_topics']
+        grand_total_other_unique += len(bucket['other_topics'])
+        grand_total_other_count += totals['other_topics']
+
+        # Calculate combined shared subscriptions (treating #share/X and #noexport/#share/X as same);
+        # kept per VPN for the summary below and merged into the grand totals.
+        # Only the distinct topics are needed: the combined total is just the
+        # two shared totals added.  Every topic here starts with its prefix,
+        # so it is sliced off directly
+        combined_shared_topics = {topic[len(SHARE_PREFIX):] for topic in bucket['share_topics']}
+        combined_shared_topics.update(topic[len(NOEXPORT_SHARE_PREFIX):]
+                                      for topic in bucket['noexport_share_topics'])
+        bucket['combined_shared_topics'] = combined_shared_topics
+
+        grand_combined_shared_topics |= combined_shared_topics
 
     grand_combined_shared_unique = len(grand_combined_shared_topics)
-    grand_combined_shared_total = sum(grand_combined_shared_topics.values())
+    grand_combined_shared_total = grand_total_share_count + grand_total_noexport_share_count
 
-    # Print summary to stdout
-    print("=" * 80)
-    print("VPN SUBSCRIPTION SUMMARY")
-    print("=" * 80)
-    print()
+    # Build the summary as a list of lines and write it to stdout at once
+    out = []
+    out.append("=" * 80)
+    out.append("VPN SUBSCRIPTION SUMMARY")
+    out.append("=" * 80)
+    out.append("")
 
     # Sort VPNs alphabetically for consistent output
     for vpn_name in sorted(vpn_data.keys()):
-        data = vpn_data[vpn_name]
-
-        share_unique = len(data['share_topics'])
-        share_total = sum(data['share_topics'].values())
-        noexport_share_unique = len(data['noexport_share_topics'])
-        noexport_share_total = sum(data['noexport_share_topics'].values())
-        other_unique = len(data['other_topics'])
-        other_total = sum(data['other_topics'].values())
-
-        # Calculate combined shared subscriptions (treating #share/X and #noexport/#share/X as same)
-        combined_shared_topics = defaultdict(int)
-        for topic, count in data['share_topics'].items():
-            value_x = topic.replace('#share/', '', 1)
-            combined_shared_topics[value_x] += count
-        for topic, count in data['noexport_share_topics'].items():
-            value_x = topic.replace('#noexport/#share/', '', 1)
-            combined_shared_topics[value_x] += count
-
-        combined_shared_unique = len(combined_shared_topics)
-        combined_shared_total = sum(combined_shared_topics.values())
+        bucket = vpn_data[vpn_name]
+
+        totals = bucket['totals']
+
+        share_unique = len(bucket['share_topics'])
+        share_total = totals['share_topics']
+        noexport_share_unique = len(bucket['noexport_share_topics'])
+        noexport_share_total = totals['noexport_share_topics']
+        other_unique = len(bucket['other_topics'])
+        other_total = totals['other_topics']
+
+        combined_shared_unique = len(bucket['combined_shared_topics'])
+        combined_shared_total = share_total + noexport_share_total
 
         total_unique = share_unique + noexport_share_unique + other_unique
         total_count = share_total + noexport_share_total + other_total
 
-        print(f"VPN: {vpn_name}")
-        print("-" * 80)
-        print(f"  Unique #share/ subscriptions:              {share_unique:>6}  (total: {share_total})")
-        print(f"  Unique #noexport/#share/ subscriptions:    {noexport_share_unique:>6}  (total: {noexport_share_total})")
-        print(f"    Unique shared (combined):                {combined_shared_unique:>6}  (total: {combined_shared_total})")
-        print(f"  Unique other subscriptions:                {other_unique:>6}  (total: {other_total})")
-        print(f"  " + "-" * 76)
-        print(f"  TOTAL subscriptions:                       {total_unique:>6}  (total: {total_count})")
-        print()
+        out.append(f"VPN: {vpn_name}")
+        out.append("-" * 80)
+        out.append(f"  Unique #share/ subscriptions:              {share_unique:>6}  (total: {share_total})")
+        out.append(f"  Unique #noexport/#share/ subscriptions:    {noexport_share_unique:>6}  (total: {noexport_share_total})")
+        out.append(f"    Unique shared (combined):                {combined_shared_unique:>6}  (total: {combined_shared_total})")
+        out.append(f"  Unique other subscriptions:                {other_unique:>6}  (total: {other_total})")
+        out.append(f"  " + "-" * 76)
+        out.append(f"  TOTAL subscriptions:                       {total_unique:>6}  (total: {total_count})")
+        out.append("")
 
         # List the unique topics with counts (only if detailed mode)
         if detailed:
             if share_unique > 0:
-                print(f"  Unique #share/ topics ({share_unique}):")
-                for topic in sorted(data['share_topics'].keys()):
-                    count = data['share_topics'][topic]
-                    print(f"    {count:>6}: {topic}")
-                print()
+                out.append(f"  Unique #share/ topics ({share_unique}):")
+                for topic in sorted(bucket['share_topics'].keys()):
+                    count = bucket['share_topics'][topic]
+                    out.append(f"    {count:>6}: {topic}")
+                out.append("")
 
             if noexport_share_unique > 0:
-                print(f"  Unique #noexport/#share/ topics ({noexport_share_unique}):")
-                for topic in sorted(data['noexport_share_topics'].keys()):
-                    count = data['noexport_share_topics'][topic]
-                    print(f"    {count:>6}: {topic}")
-                print()
+                out.append(f"  Unique #noexport/#share/ topics ({noexport_share_unique}):")
+                for topic in sorted(bucket['noexport_share_topics'].keys()):
+                    count = bucket['noexport_share_topics'][topic]
+                    out.append(f"    {count:>6}: {topic}")
+                out.append("")
 
             if other_unique > 0:
-                print(f"  Unique other topics ({other_unique}):")
-                for topic in sorted(data['other_topics'].keys()):
-                    count = data['other_topics'][topic]
-                    print(f"    {count:>6}: {topic}")
-                print()
+                out.append(f"  Unique other topics ({other_unique}):")
+                for topic in sorted(bucket['other_topics'].keys()):
+                    count = bucket['other_topics'][topic]
+                    out.append(f"    {count:>6}: {topic}")
+                out.append("")
 
     # Grand totals section
-    print("=" * 80)
-    print("GRAND TOTALS (ALL VPNs)")
-    print("=" * 80)
-    print(f"  Unique #share/ subscriptions:              {grand_total_share_unique:>6}  (total: {grand_total_share_count})")
-    print(f"  Unique #noexport/#share/ subscriptions:    {grand_total_noexport_share_unique:>6}  (total: {grand_total_noexport_share_count})")
-    print(f"    Unique shared (combined):                {grand_combined_shared_unique:>6}  (total: {grand_combined_shared_total})")
-    print(f"  Unique other subscriptions:                {grand_total_other_unique:>6}  (total: {grand_total_other_count})")
-    print(f"  " + "-" * 76)
+    out.append("=" * 80)
+    out.append("GRAND TOTALS (ALL VPNs)")
+    out.append("=" * 80)
+    out.append(f"  Unique #share/ subscriptions:              {grand_total_share_unique:>6}  (total: {grand_total_share_count})")
+    out.append(f"  Unique #noexport/#share/ subscriptions:    {grand_total_noexport_share_unique:>6}  (total: {grand_total_noexport_share_count})")
+    out.append(f"    Unique shared (combined):                {grand_combined_shared_unique:>6}  (total: {grand_combined_shared_total})")
+    out.append(f"  Unique other subscriptions:                {grand_total_other_unique:>6}  (total: {grand_total_other_count})")
+    out.append(f"  " + "-" * 76)
     grand_total_unique_all = grand_total_share_unique + grand_total_noexport_share_unique + grand_total_other_unique
     grand_total_all = grand_total_share_count + grand_total_noexport_share_count + grand_total_other_count
-    print(f"  TOTAL subscriptions:                       {grand_total_unique_all:>6}  (total: {grand_total_all})")
-    print()
-    print("=" * 80)
-    print("END OF SUMMARY")
-    print("=" * 80)
+    out.append(f"  TOTAL subscriptions:                       {grand_total_unique_all:>6}  (total: {grand_total_all})")
+    out.append("")
+    out.append("=" * 80)
+    out.append("END OF SUMMARY")
+    out.append("=" * 80)
 
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 def main():
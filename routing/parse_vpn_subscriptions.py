@@ -5,12 +5,30 @@ Parse VPN subscription data from text or XML file and convert to JSON.
 Supports two input formats:
 1. Text format: Fixed-width columns with VPN sections
 2. XML format: SEMP XML output with subscription elements
+
+Only the standard library is needed (orjson is used for the JSON output when
+installed), so the script also runs unchanged under PyPy, whose JIT speeds up
+the pure-Python fixed-width text parser on large files.
 """
 
 import re
 import json
 import sys
 import xml.etree.ElementTree as ET
+from collections import Counter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# VPN section header: "Message VPN : prod (exported: No; 100% complete)"
+_VPN_HEADER_RE = re.compile(r'Message VPN\s*:\s*(\S+)\s*\(exported:\s*(\w+);\s*(.+)\)')
+
+# Flags legend lines, and (after stripping) the legend's continuation,
+# the 'T P R' column header line and the '---' separator
+_SKIP_PREFIXES = ('Flags Legend:', 'T -', 'P -', 'R -')
+_SKIP_STRIPPED_PREFIXES = ('R=remote-router', 'S=static', 'T P R', '---')
 
 
 def expand_flag_type(flag):
@@ -74,17 +92,28 @@ def detect_file_format(filename):
 
 
 def parse_xml_file(filename):
-    """Parse XML format VPN subscription file."""
-    try:
-        tree = ET.parse(filename)
-        root = tree.getroot()
+    """
+    Parse XML format VPN subscription file.
 
-        # Navigate to subscriptions: rpc > show > smrp > subscriptions > subscription
+    The file is read with iterparse and each <subscription> element is
+    dropped from the tree once its fields are extracted, so only the
+    elements not yet handled are held in memory rather than the whole DOM.
+    """
+    try:
+        # Subscriptions sit at rpc > show > smrp > subscriptions > subscription,
+        # but the path might vary, so every 'subscription' element is taken
         subscriptions = []
+        # Open elements, innermost last, to find each subscription's parent
+        open_elems = []
+
+        for event, sub_elem in ET.iterparse(filename, events=('start', 'end')):
+            if event == 'start':
+                open_elems.append(sub_elem)
+                continue
+            open_elems.pop()
+            if sub_elem.tag != 'subscription' or not open_elems:
+                continue
 
-        # Find all subscription elements
-        # The path might vary, so let's search for all 'subscription' elements
-        for sub_elem in root.findall('.//subscription'):
             vpn_name = sub_elem.findtext('vpn-name', '').strip()
             destination_name = sub_elem.findtext('destination-name', '').strip()
             destination_type = sub_elem.findtext('destination-type', '').strip()
@@ -106,6 +135,7 @@ def parse_xml_file(filename):
                 'subscription': topic
             }
             subscriptions.append(subscription)
+            open_elems[-1].remove(sub_elem)
 
         if not subscriptions:
             raise ValueError("No subscription elements found in XML file")
@@ -121,143 +151,125 @@ def parse_xml_file(filename):
 def parse_text_file(filename):
     """Parse the VPN subscription file and return structured data."""
 
-    with open(filename, 'r') as f:
-        lines = f.readlines()
-
-    vpns = []
+    all_subscriptions = []
     current_vpn = None
     current_entry = None
     in_data_section = False
 
-    for line_num, line in enumerate(lines, 1):
-        # Remove newline but preserve spaces for indentation detection
-        line = line.rstrip('\n')
-
-        # Skip empty lines
-        if not line.strip():
-            continue
-
-        # Skip legend lines
-        if line.startswith('Flags Legend:') or line.startswith('T -') or \
-           line.startswith('P -') or line.startswith('R -') or \
-           line.strip().startswith('R=remote-router') or \
-           line.strip().startswith('S=static'):
-            continue
-
-        # Check for VPN header: "Message VPN : prod (exported: No; 100% complete)"
-        vpn_match = re.match(r'Message VPN\s*:\s*(\S+)\s*\(exported:\s*(\w+);\s*(.+)\)', line)
-        if vpn_match:
-            # Save previous VPN if exists
-            if current_vpn is not None:
-                if current_entry is not None:
-                    current_vpn['subscriptions'].append(current_entry)
-                vpns.append(current_vpn)
-
-            # Start new VPN section
-            vpn_name = vpn_match.group(1)
-            exported = vpn_match.group(2)
-            completion = vpn_match.group(3)
-
-            current_vpn = {
-                'vpn_name': vpn_name,
-                'exported': exported,
-                'completion': completion,
-                'subscriptions': []
-            }
-            current_entry = None
-            in_data_section = False
-            continue
-
-        # Skip header and separator lines
-        if 'Destination Name' in line and 'Flags' in line:
-            in_data_section = True
-            continue
-        if line.strip().startswith('T P R') or line.strip().startswith('---'):
-            continue
-
-        # Process data lines (only after we've seen headers)
-        if in_data_section and current_vpn is not None:
-            # Check if this is a continuation line (starts with 2+ spaces)
-            if line.startswith('  '):
-                # This is a continuation line
-                if current_entry is not None:
-                    # Parse continuation line using fixed-width columns
-                    # The destination name continues up to column 25
-                    # The subscription continues from column 41
-                    dest_part = line[:25].strip()
-                    sub_part = line[41:].strip() if len(line) > 41 else ''
-
-                    if dest_part:
-                        current_entry['destination_name'] += dest_part
-                    if sub_part:
-                        if current_entry['subscription']:
-                            current_entry['subscription'] += sub_part
-                        else:
-                            current_entry['subscription'] = sub_part
-            else:
-                # This is a new entry line
-                # Save previous entry
-                if current_entry is not None:
-                    current_vpn['subscriptions'].append(current_entry)
-
-                # Parse the new entry using fixed-width columns
-                # Format based on header alignment:
-                # Destination Name: columns 0-24
-                # Flag T: column 25
-                # Flag P: column 27
-                # Flag R: column 29
-                # BlkID: columns 30-35 (right-aligned)
-                # DTO Prio: columns 36-40 (right-aligned)
-                # Subscription: column 41+
-
-                destination_name = line[:25].strip()
-                flag_t = line[25:26].strip() if len(line) > 25 else ''
-                flag_p = line[27:28].strip() if len(line) > 27 else ''
-                flag_r = line[29:30].strip() if len(line) > 29 else ''
-                blk_id = line[30:36].strip() if len(line) > 30 else ''
-                dto_prio = line[36:41].strip() if len(line) > 36 else ''
-                subscription = line[41:].strip() if len(line) > 41 else ''
-
-                # Only create entry if we have minimum required fields
-                if destination_name and flag_t:
-                    current_entry = {
-                        'destination_name': destination_name,
-                        'destination_type': expand_flag_type(flag_t),
-                        'persistence': expand_flag_persistence(flag_p),
-                        'redundancy': expand_flag_redundancy(flag_r),
-                        'block_id': blk_id,
-                        'dto_priority': dto_prio,
-                        'subscription': subscription
-                    }
+    with open(filename, 'r') as f:
+        for line in f:
+            # Remove newline but preserve spaces for indentation detection
+            line = line.rstrip('\n')
+            stripped = line.strip()
+
+            # Skip empty lines
+            if not stripped:
+                continue
+
+            # Skip legend, column header and separator lines
+            if line.startswith(_SKIP_PREFIXES) or \
+               stripped.startswith(_SKIP_STRIPPED_PREFIXES):
+                continue
+
+            # Check for VPN header
+            vpn_match = _VPN_HEADER_RE.match(line)
+            if vpn_match:
+                # Start new VPN section
+                vpn_name = vpn_match.group(1)
+                exported = vpn_match.group(2)
+                completion = vpn_match.group(3)
+
+                current_vpn = {
+                    'vpn_name': vpn_name,
+                    'exported': exported,
+                    'completion': completion
+                }
+                current_entry = None
+                in_data_section = False
+                continue
+
+            # The column header starts the data section
+            if 'Destination Name' in line and 'Flags' in line:
+                in_data_section = True
+                continue
+
+            # Process data lines (only after we've seen headers)
+            if in_data_section and current_vpn is not None:
+                # Check if this is a continuation line (starts with 2+ spaces)
+                if line.startswith('  '):
+                    # This is a continuation line
+                    if current_entry is not None:
+                        # Parse continuation line using fixed-width columns
+                        # The destination name continues up to column 25
+                        # The subscription continues from column 41
+                        dest_part = line[:25].strip()
+                        sub_part = line[41:].strip()
+
+                        if dest_part:
+                            current_entry['destination_name'] += dest_part
+                        if sub_part:
+                            if current_entry['subscription']:
+                                current_entry['subscription'] += sub_part
+                            else:
+                                current_entry['subscription'] = sub_part
                 else:
-                    # Malformed line, skip
-                    continue
+                    # This is a new entry line
+                    # Parse the new entry using fixed-width columns
+                    # Format based on header alignment:
+                    # Destination Name: columns 0-24
+                    # Flag T: column 25
+                    # Flag P: column 27
+                    # Flag R: column 29
+                    # BlkID: columns 30-35 (right-aligned)
+                    # DTO Prio: columns 36-40 (right-aligned)
+                    # Subscription: column 41+
+                    # (slices past the end of a short line are just empty)
+
+                    destination_name = line[:25].strip()
+                    flag_t = line[25:26].strip()
+                    flag_p = line[27:28].strip()
+                    flag_r = line[29:30].strip()
+                    blk_id = line[30:36].strip()
+                    dto_prio = line[36:41].strip()
+                    subscription = line[41:].strip()
+
+                    # Only create entry if we have minimum required fields.
+                    # It is built with vpn_name first, in output order, and listed
+                    # straight away; continuation lines extend it in place
+                    if destination_name and flag_t:
+                        current_entry = {
+                            'vpn_name': current_vpn['vpn_name'],
+                            'destination_name': destination_name,
+                            'destination_type': expand_flag_type(flag_t),
+                            'persistence': expand_flag_persistence(flag_p),
+                            'redundancy': expand_flag_redundancy(flag_r),
+                            'block_id': blk_id,
+                            'dto_priority': dto_prio,
+                            'subscription': subscription
+                        }
+                        all_subscriptions.append(current_entry)
+                    else:
+                        # Malformed line, skip
+                        continue
 
-    # Don't forget the last VPN and entry
-    if current_entry is not None and current_vpn is not None:
-        current_vpn['subscriptions'].append(current_entry)
-    if current_vpn is not None:
-        vpns.append(current_vpn)
+    return {'subscriptions': all_subscriptions}
 
-    # Flatten structure: include vpn_name in each subscription
-    all_subscriptions = []
-    for vpn in vpns:
-        vpn_name = vpn['vpn_name']
-        for subscription in vpn['subscriptions']:
-            # Create new ordered dict with vpn_name first
-            ordered_subscription = {
-                'vpn_name': vpn_name,
-                'destination_name': subscription['destination_name'],
-                'destination_type': subscription['destination_type'],
-                'persistence': subscription['persistence'],
-                'redundancy': subscription['redundancy'],
-                'block_id': subscription['block_id'],
-                'dto_priority': subscription['dto_priority'],
-                'subscription': subscription['subscription']
-            }
-            all_subscriptions.append(ordered_subscription)
 
-    return {'subscriptions': all_subscriptions}
+def write_json(data):
+    """
+    Write data to stdout as indented JSON with a final newline.
+
+    orjson serializes the whole document in C and it is written in one call;
+    without it the stdlib encoder is used.  orjson writes non-ASCII text as
+    UTF-8 rather than \\u escapes, which is the same JSON.
+    """
+    if orjson:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b'\n')
+        return
+    json.dump(data, sys.stdout, indent=2)
+    print()  # Add final newline
 
 
 def print_help():
@@ -288,6 +300,11 @@ OUTPUT:
     The script outputs JSON to stdout. You can redirect the output to a file:
         parse_vpn_subscriptions.py input.txt > output.json
 
+PYPY:
+    The parser is plain Python with no required C extensions, so large text
+    files can be parsed faster by running it under PyPy:
+        pypy3 parse_vpn_subscriptions.py input.txt > output.json
+
 EXAMPLES:
     # Parse file and display JSON to terminal
     parse_vpn_subscriptions.py shared_subs_with_noexport.txt
@@ -355,18 +372,14 @@ def main():
         sys.exit(1)
 
     # Count subscriptions by VPN (print to stderr so it doesn't interfere with JSON output)
-    vpn_counts = {}
-    for sub in data['subscriptions']:
-        vpn_name = sub['vpn_name']
-        vpn_counts[vpn_name] = vpn_counts.get(vpn_name, 0) + 1
+    vpn_counts = Counter(sub['vpn_name'] for sub in data['subscriptions'])
 
     print(f"Successfully parsed {len(data['subscriptions'])} subscription(s)", file=sys.stderr)
     for vpn_name, count in vpn_counts.items():
         print(f"  VPN '{vpn_name}': {count} subscription(s)", file=sys.stderr)
 
     # Output JSON to stdout
-    json.dump(data, sys.stdout, indent=2)
-    print()  # Add final newline
+    write_json(data)
 
 
 if __name__ == '__main__':